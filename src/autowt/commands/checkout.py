@@ -21,6 +21,10 @@ from autowt.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Terminal modes that don't actually switch terminals, so post_create_async
+# hooks run before the (no-op) switch instead of after it
+EARLY_ASYNC_MODES = frozenset({TerminalMode.ECHO, TerminalMode.INPLACE})
+
 
 def _combine_after_init_and_custom_script(
     after_init: str | None, custom_script: CustomScript | None
@@ -431,10 +435,7 @@ def _create_new_worktree(
 
     # Determine if terminal mode performs an actual switch
     # ECHO/INPLACE modes don't actually switch terminals
-    runs_async_before_switch = terminal_mode in (
-        TerminalMode.ECHO,
-        TerminalMode.INPLACE,
-    )
+    runs_async_before_switch = terminal_mode in EARLY_ASYNC_MODES
 
     # For ECHO/INPLACE modes, run async hooks before switching (since no actual switch happens)
     if runs_async_before_switch:
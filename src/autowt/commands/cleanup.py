@@ -79,7 +79,7 @@ def cleanup_worktrees(cleanup_cmd: CleanupCommand, services: Services) -> None:
     # If specific worktrees were provided, handle them directly
     if cleanup_cmd.worktrees:
         # Resolve each worktree arg to a branch name
-        resolved_branches = []
+        resolved_branches = set()
         for wt_arg in cleanup_cmd.worktrees:
             try:
                 branch = resolve_worktree_argument(wt_arg, services)
@@ -91,7 +91,7 @@ def cleanup_worktrees(cleanup_cmd: CleanupCommand, services: Services) -> None:
                     services,
                     apply_to_new_branches=False,
                 )
-                resolved_branches.append(canonical_branch)
+                resolved_branches.add(canonical_branch)
             except ValueError as e:
                 print_error(str(e))
                 return
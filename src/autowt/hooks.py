@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from autowt.config import HookConfig
+from autowt.utils import clear_command_cache
 
 if TYPE_CHECKING:
     from autowt.models import CustomScript
@@ -121,6 +122,9 @@ class HookRunner:
         except Exception as e:
             logger.error(f"Failed to execute {hook_type} hook: {e}")
             return False
+        finally:
+            # Hook scripts can add worktrees or switch branches behind our back
+            clear_command_cache()
 
     def run_hooks(
         self,
@@ -37,7 +37,7 @@ class CleanupMode(Enum):
     GITHUB = "github"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorktreeInfo:
     """Information about a single worktree."""
 
@@ -47,7 +47,7 @@ class WorktreeInfo:
     is_primary: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BranchStatus:
     """Status information for cleanup decisions."""
 
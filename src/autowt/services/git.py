@@ -6,7 +6,13 @@ from pathlib import Path
 
 from autowt.models import BranchStatus, WorktreeInfo
 from autowt.prompts import confirm_default_no
-from autowt.utils import run_command, run_command_quiet_on_failure, run_command_visible
+from autowt.utils import (
+    clear_command_cache,
+    run_command,
+    run_command_cached,
+    run_command_quiet_on_failure,
+    run_command_visible,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -312,7 +318,7 @@ class GitService:
         """Check if the given path is a git repository."""
         try:
             # Check for regular git repository
-            result = run_command(
+            result = run_command_cached(
                 ["git", "rev-parse", "--git-dir"],
                 cwd=path,
                 timeout=10,
@@ -389,7 +395,7 @@ class GitService:
 
     def _execute_worktree_list_command(self, repo_path: Path):
         """Execute git worktree list command."""
-        return run_command(
+        return run_command_cached(
             ["git", "worktree", "list", "--porcelain"],
             cwd=repo_path,
             timeout=30,
@@ -894,6 +900,7 @@ class GitService:
                 timeout=10,
                 description=f"Delete branch {branch}",
             )
+            clear_command_cache()
             return result.returncode == 0
         except Exception:
             return False
@@ -901,7 +908,7 @@ class GitService:
     def _is_bare_repo(self, path: Path) -> bool:
         """Check if the given path is a bare git repository."""
         try:
-            result = run_command(
+            result = run_command_cached(
                 ["git", "rev-parse", "--is-bare-repository"],
                 cwd=path,
                 timeout=10,
@@ -119,11 +119,11 @@ class TerminalService:
         self, session_init_script: str | None, after_init: str | None
     ) -> str | None:
         """Combine init script and after-init command into a single script."""
-        scripts = []
-        if session_init_script:
-            scripts.append(session_init_script)
-        if after_init:
-            scripts.append(after_init)
+        scripts = [
+            script
+            for script in (session_init_script, after_init)
+            if script and not script.isspace()
+        ]
         return "; ".join(scripts) if scripts else None
 
     def _echo_commands(
@@ -171,10 +171,9 @@ class TerminalService:
         logger.debug(f"Executing cd command in current session for {worktree_path}")
 
         commands = [f"cd {shlex.quote(str(worktree_path))}"]
-        if session_init_script:
-            commands.append(session_init_script)
-        if after_init:
-            commands.append(after_init)
+        combined_script = self._combine_scripts(session_init_script, after_init)
+        if combined_script:
+            commands.append(combined_script)
 
         combined_command = "; ".join(commands)
 
@@ -29,6 +29,42 @@ def is_interactive_terminal() -> bool:
     return sys.stdin.isatty()
 
 
+class _LazyJoin:
+    """Defer shlex.join() of a command until a log record is actually emitted."""
+
+    __slots__ = ("cmd",)
+
+    def __init__(self, cmd: list[str]):
+        self.cmd = cmd
+
+    def __str__(self) -> str:
+        return shlex.join(self.cmd)
+
+
+def _run_subprocess(
+    cmd: list[str],
+    cwd: Path | None,
+    capture_output: bool,
+    text: bool,
+    timeout: int | None,
+) -> subprocess.CompletedProcess:
+    """Run cmd, decoding captured output as UTF-8 when text is requested.
+
+    Output is decoded as UTF-8 rather than the locale encoding, with universal
+    newline translation as for text=True. Undecodable bytes are replaced instead
+    of raising, since git paths and branch names are not guaranteed to be UTF-8.
+    """
+    return subprocess.run(
+        cmd,
+        cwd=cwd,
+        capture_output=capture_output,
+        timeout=timeout,
+        text=text,
+        encoding="utf-8" if text else None,
+        errors="replace" if text else None,
+    )
+
+
 def run_command(
     cmd: list[str],
     cwd: Path | None = None,
@@ -38,46 +74,41 @@ def run_command(
     description: str | None = None,
 ) -> subprocess.CompletedProcess:
     """Run a subprocess command with debug logging only."""
-    cmd_str = shlex.join(cmd)
+    cmd_str = _LazyJoin(cmd)
 
     # Only log at debug level - this is for read-only operations
     if description:
-        command_logger.debug(f"{description}: {cmd_str}")
+        command_logger.debug("%s: %s", description, cmd_str)
     else:
-        command_logger.debug(f"Running: {cmd_str}")
+        command_logger.debug("Running: %s", cmd_str)
 
     if cwd:
-        command_logger.debug(f"Working directory: {cwd}")
+        command_logger.debug("Working directory: %s", cwd)
 
     # Run the command
     try:
-        result = subprocess.run(
-            cmd, cwd=cwd, capture_output=capture_output, text=text, timeout=timeout
-        )
+        result = _run_subprocess(cmd, cwd, capture_output, text, timeout)
 
         # Log result - failures are only warnings if they have stderr output
         if result.returncode == 0:
-            command_logger.debug(f"Command succeeded (exit code: {result.returncode})")
+            command_logger.debug("Command succeeded (exit code: %s)", result.returncode)
         else:
             # Many commands are expected to fail (checking for existence, etc.)
             # Only warn if there's actual error output, otherwise just debug
             if result.stderr and result.stderr.strip():
                 command_logger.warning(
-                    f"Command failed (exit code: {result.returncode})"
+                    "Command failed (exit code: %s)", result.returncode
                 )
-                command_logger.warning(f"Error output: {result.stderr.strip()}")
+                command_logger.warning("Error output: %s", result.stderr.strip())
             else:
                 command_logger.debug(
-                    f"Command completed (exit code: {result.returncode})"
+                    "Command completed (exit code: %s)", result.returncode
                 )
 
         return result
 
     except subprocess.TimeoutExpired:
-        command_logger.error(f"Command timed out after {timeout}s: {cmd_str}")
-        raise
-    except Exception as e:
-        command_logger.error(f"Command failed with exception: {e}")
+        command_logger.error("Command timed out after %ss: %s", timeout, cmd_str)
         raise
 
 
@@ -97,33 +128,69 @@ def run_command_visible(
     # Show the command with a clear prefix
     print_command(cmd_str)
 
+    # Visible commands change repository state, so cached queries are stale
+    clear_command_cache()
+
     if cwd:
-        command_logger.debug(f"Working directory: {cwd}")
+        command_logger.debug("Working directory: %s", cwd)
 
     # Run the command
     try:
-        result = subprocess.run(
-            cmd, cwd=cwd, capture_output=capture_output, text=text, timeout=timeout
-        )
+        result = _run_subprocess(cmd, cwd, capture_output, text, timeout)
 
         # Log result
         if result.returncode == 0:
-            command_logger.debug(f"Command succeeded (exit code: {result.returncode})")
+            command_logger.debug("Command succeeded (exit code: %s)", result.returncode)
         else:
-            command_logger.warning(f"Command failed (exit code: {result.returncode})")
+            command_logger.warning("Command failed (exit code: %s)", result.returncode)
             if result.stderr:
-                command_logger.warning(f"Error output: {result.stderr.strip()}")
+                command_logger.warning("Error output: %s", result.stderr.strip())
 
         return result
 
     except subprocess.TimeoutExpired:
-        command_logger.error(f"Command timed out after {timeout}s: {cmd_str}")
-        raise
-    except Exception as e:
-        command_logger.error(f"Command failed with exception: {e}")
+        command_logger.error("Command timed out after %ss: %s", timeout, cmd_str)
         raise
 
 
+# Results of read-only commands, keyed on (cmd, cwd, timeout)
+_command_cache: dict[
+    tuple[tuple[str, ...], Path | None, int | None], subprocess.CompletedProcess
+] = {}
+
+
+def run_command_cached(
+    cmd: list[str],
+    cwd: Path | None = None,
+    timeout: int | None = None,
+    description: str | None = None,
+) -> subprocess.CompletedProcess:
+    """Run a read-only command, reusing the result of an identical earlier call.
+
+    Only use this for queries whose output cannot change unless autowt itself
+    modifies the repository. Only successful results are kept. Call clear_command_cache() after any state-changing
+    operation so later queries see fresh results.
+    """
+    key = (tuple(cmd), cwd, timeout)
+    result = _command_cache.get(key)
+    if result is not None:
+        command_logger.debug(
+            "%s (cached): %s", description or "Running", _LazyJoin(cmd)
+        )
+        return result
+
+    result = run_command(cmd, cwd=cwd, timeout=timeout, description=description)
+    # Failures may be transient (e.g. index.lock contention), so retry them
+    if result.returncode == 0:
+        _command_cache[key] = result
+    return result
+
+
+def clear_command_cache() -> None:
+    """Forget all results memoized by run_command_cached()."""
+    _command_cache.clear()
+
+
 def run_command_quiet_on_failure(
     cmd: list[str],
     cwd: Path | None = None,
@@ -133,43 +200,66 @@ def run_command_quiet_on_failure(
     description: str | None = None,
 ) -> subprocess.CompletedProcess:
     """Run a command that's expected to sometimes fail without stderr warnings."""
-    cmd_str = shlex.join(cmd)
+    cmd_str = _LazyJoin(cmd)
 
     # Log the command at debug level
     if description:
-        command_logger.debug(f"{description}: {cmd_str}")
+        command_logger.debug("%s: %s", description, cmd_str)
     else:
-        command_logger.debug(f"Running: {cmd_str}")
+        command_logger.debug("Running: %s", cmd_str)
 
     if cwd:
-        command_logger.debug(f"Working directory: {cwd}")
+        command_logger.debug("Working directory: %s", cwd)
 
     # Run the command
     try:
-        result = subprocess.run(
-            cmd, cwd=cwd, capture_output=capture_output, text=text, timeout=timeout
-        )
+        result = _run_subprocess(cmd, cwd, capture_output, text, timeout)
 
         # Log result at debug level only
         if result.returncode == 0:
-            command_logger.debug(f"Command succeeded (exit code: {result.returncode})")
+            command_logger.debug("Command succeeded (exit code: %s)", result.returncode)
         else:
-            command_logger.debug(f"Command completed (exit code: {result.returncode})")
+            command_logger.debug("Command completed (exit code: %s)", result.returncode)
             if result.stderr:
-                command_logger.debug(f"Error output: {result.stderr.strip()}")
+                command_logger.debug("Error output: %s", result.stderr.strip())
 
         return result
 
     except subprocess.TimeoutExpired:
-        command_logger.error(f"Command timed out after {timeout}s: {cmd_str}")
-        raise
-    except Exception as e:
-        command_logger.error(f"Command failed with exception: {e}")
+        command_logger.error("Command timed out after %ss: %s", timeout, cmd_str)
         raise
 
 
+# Byte tables for the ASCII fast path of sanitize_branch_name: separators map to
+# hyphens, and anything that isn't alphanumeric or -_. is dropped.
+_SANITIZE_MAP = bytes.maketrans(b"/ \\", b"---")
+_SANITIZE_DROP = bytes(
+    i for i in range(256) if not (chr(i).isalnum() or chr(i) in "-_./\\ ")
+)
+
+
+# Conventional "<type>/<name>" branches that only need their slash replaced.
+# The name must not end in "." or "-", which the general path would strip.
+_CONVENTIONAL_BRANCH_RE = re.compile(
+    r"(?:feature|bugfix|hotfix|release|docs|refactor|perf|test|chore|ci|build"
+    r"|style|revert)/[A-Za-z0-9._-]*[A-Za-z0-9_]\Z"
+)
+
+
 def sanitize_branch_name(branch: str) -> str:
     """Sanitize branch name for use in filesystem paths."""
+    if _CONVENTIONAL_BRANCH_RE.match(branch):
+        return branch.replace("/", "-")
+
+    if branch.isascii():
+        sanitized = (
+            branch.encode("ascii")
+            .translate(_SANITIZE_MAP, _SANITIZE_DROP)
+            .decode("ascii")
+            .strip(".-")
+        )
+        return sanitized or "branch"
+
     # Replace problematic characters with hyphens
     sanitized = branch.replace("/", "-").replace(" ", "-").replace("\\", "-")
 
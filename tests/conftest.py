@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from autowt.utils import clear_command_cache
 from tests.fixtures.config_fixtures import build_sample_config
 from tests.fixtures.git_fixtures import (
     build_sample_branch_statuses,
@@ -12,54 +13,97 @@ from tests.fixtures.git_fixtures import (
 from tests.fixtures.service_builders import MockServices, MockTerminalService
 
 
-@pytest.fixture
-def temp_repo_path(tmp_path):
-    """Create a temporary repository path."""
-    repo_path = tmp_path / "test-repo"
+@pytest.fixture(scope="session")
+def temp_repo_path(tmp_path_factory):
+    """Create a temporary repository path shared by the whole session."""
+    repo_path = tmp_path_factory.mktemp("repo") / "test-repo"
     repo_path.mkdir()
     return repo_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config():
-    """Sample configuration for testing."""
+    """Sample configuration for testing; Config is frozen, so it is shared."""
     return build_sample_config()
 
 
+@pytest.fixture(scope="session")
+def _sample_worktrees(temp_repo_path):
+    """Immutable sample worktrees, built once per session."""
+    return tuple(build_sample_worktrees(temp_repo_path))
+
+
+@pytest.fixture(scope="session")
+def _sample_branch_statuses(_sample_worktrees):
+    """Immutable sample branch statuses, built once per session."""
+    return tuple(build_sample_branch_statuses(list(_sample_worktrees)))
+
+
 @pytest.fixture
-def sample_worktrees(temp_repo_path):
-    """Sample worktree data for testing."""
-    return build_sample_worktrees(temp_repo_path)
+def sample_worktrees(_sample_worktrees):
+    """Sample worktree data for testing.
+
+    Returns a fresh list so tests may append or remove entries.
+    """
+    return list(_sample_worktrees)
 
 
 @pytest.fixture
-def sample_branch_statuses(sample_worktrees):
+def sample_branch_statuses(_sample_branch_statuses):
     """Sample branch status data for testing."""
-    return build_sample_branch_statuses(sample_worktrees)
+    return list(_sample_branch_statuses)
+
+
+@pytest.fixture(scope="session")
+def _terminal_operation_patchers():
+    """Start the terminal-operation patches once for the whole session.
+
+    Returns the patchers alongside their active mocks so per-test fixtures can
+    reset them, or pause them for integration tests.
+    """
+    patchers = {
+        "run_command": patch(
+            "autowt.utils.run_command", return_value=Mock(returncode=0)
+        ),
+        "platform": patch("platform.system", return_value="Darwin"),
+    }
+    mocks = {name: patcher.start() for name, patcher in patchers.items()}
+    yield patchers, mocks
+    for patcher in patchers.values():
+        patcher.stop()
 
 
 @pytest.fixture(autouse=True)
-def mock_terminal_operations(request):
+def mock_terminal_operations(request, _terminal_operation_patchers):
     """Automatically mock potentially harmful terminal operations in unit tests.
 
     Integration tests (in tests/integration/) are excluded since they need real
     git operations.
     """
-    # Skip mocking for integration tests
+    patchers, mocks = _terminal_operation_patchers
+
+    # Pause mocking for integration tests
     if "integration" in str(request.fspath):
+        for patcher in patchers.values():
+            patcher.stop()
         yield {}
+        for name, patcher in patchers.items():
+            mocks[name] = patcher.start()
         return
 
-    with (
-        patch(
-            "autowt.utils.run_command", return_value=Mock(returncode=0)
-        ) as mock_run_command,
-        patch("platform.system", return_value="Darwin") as mock_platform,
-    ):
-        yield {
-            "run_command": mock_run_command,
-            "platform": mock_platform,
-        }
+    mocks["run_command"].reset_mock(return_value=True, side_effect=True)
+    mocks["run_command"].return_value = Mock(returncode=0)
+    mocks["platform"].reset_mock(return_value=True, side_effect=True)
+    mocks["platform"].return_value = "Darwin"
+    yield dict(mocks)
+
+
+@pytest.fixture(autouse=True)
+def reset_command_cache():
+    """Keep memoized git query results from leaking between tests."""
+    clear_command_cache()
+    yield
+    clear_command_cache()
 
 
 @pytest.fixture
@@ -85,8 +85,8 @@ class MockGitService:
 
     def __init__(self):
         self.repo_root: Path | None = None
-        self.worktrees: list[WorktreeInfo] = []
-        self.branch_statuses: list[BranchStatus] = []
+        self.worktrees = []
+        self.branch_statuses = []
         self.current_branch = "main"
         self.fetch_success = True
         self.create_success = True
@@ -100,6 +100,24 @@ class MockGitService:
         self.remove_worktree_calls = []
         self.install_hooks_called = False
 
+    # Stored as immutable tuples so in-place edits cannot bypass the setters;
+    # each query hands out a fresh list, as the real GitService does.
+    @property
+    def worktrees(self) -> tuple[WorktreeInfo, ...]:
+        return self._worktrees
+
+    @worktrees.setter
+    def worktrees(self, value: list[WorktreeInfo]) -> None:
+        self._worktrees = tuple(value)
+
+    @property
+    def branch_statuses(self) -> tuple[BranchStatus, ...]:
+        return self._branch_statuses
+
+    @branch_statuses.setter
+    def branch_statuses(self, value: list[BranchStatus]) -> None:
+        self._branch_statuses = tuple(value)
+
     def find_repo_root(self, start_path: Path | None = None) -> Path | None:
         return self.repo_root
 
@@ -110,7 +128,7 @@ class MockGitService:
         return self.current_branch
 
     def list_worktrees(self, repo_path: Path) -> list[WorktreeInfo]:
-        return self.worktrees.copy()
+        return list(self._worktrees)
 
     def get_current_worktree(
         self, current_path: Path, worktrees: list[WorktreeInfo]
@@ -141,9 +159,10 @@ class MockGitService:
         )
         if self.create_success:
             # Add to our mock worktree list
-            self.worktrees.append(
-                WorktreeInfo(branch=branch, path=worktree_path, is_current=False)
-            )
+            self.worktrees = [
+                *self.worktrees,
+                WorktreeInfo(branch=branch, path=worktree_path, is_current=False),
+            ]
         return self.create_success
 
     def remove_worktree(
@@ -169,7 +188,7 @@ class MockGitService:
         worktrees: list[WorktreeInfo],
         preferred_remote: str | None = None,
     ) -> list[BranchStatus]:
-        return self.branch_statuses.copy()
+        return list(self._branch_statuses)
 
     def install_hooks(self, repo_path: Path) -> bool:
         self.install_hooks_called = True
@@ -0,0 +1,24 @@
+"""Shared fixtures for CLI tests."""
+
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """One CliRunner for the session; each invoke() isolates its own streams."""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_get_config(monkeypatch):
+    """Skip config initialization and stub the config the CLI reads.
+
+    Tests set ``mock_get_config.return_value`` to the config they need.
+    """
+    monkeypatch.setattr("autowt.cli.initialize_config", lambda *args, **kwargs: None)
+    get_config = Mock()
+    monkeypatch.setattr("autowt.cli.get_config", get_config)
+    return get_config
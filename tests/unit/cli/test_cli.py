@@ -1,8 +1,9 @@
 """Tests for CLI command routing and argument handling."""
 
+from functools import cache
 from unittest.mock import Mock, patch
 
-from click.testing import CliRunner
+import pytest
 
 from autowt.cli import main
 from autowt.models import CleanupMode, CustomScript
@@ -40,13 +41,31 @@ def create_mock_config(
     return mock_config
 
 
+@pytest.fixture(scope="session")
+def help_outputs(runner):
+    """Render built-in help text once per argv for the whole session.
+
+    Help is rendered with no custom scripts configured, so it only depends on
+    the CLI definition. Call with the argv as positional strings.
+    """
+
+    @cache
+    def render(*args):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("autowt.cli.initialize_config", lambda *a, **k: None)
+            mp.setattr("autowt.cli.get_config", create_mock_config)
+            result = runner.invoke(main, list(args))
+        assert result.exit_code == 0, result.output
+        return result.output
+
+    return render
+
+
 class TestCLIRouting:
     """Tests for CLI command routing and fallback behavior."""
 
-    def test_explicit_commands_work(self):
+    def test_explicit_commands_work(self, runner, mock_get_config):
         """Test that explicit subcommands work correctly."""
-        runner = CliRunner()
-
         # Mock all the command functions to avoid actual execution
         with (
             patch("autowt.cli.list_worktrees") as mock_ls,
@@ -54,8 +73,6 @@ class TestCLIRouting:
             patch("autowt.cli.configure_settings") as mock_configure,
             patch("autowt.cli.create_services") as mock_create_services,
             patch("autowt.cli.is_interactive_terminal", return_value=True),
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             # Setup mock services
             mock_services = MockServices()
@@ -87,15 +104,11 @@ class TestCLIRouting:
             assert result.exit_code == 0
             mock_configure.assert_called_once()
 
-    def test_switch_command_works(self):
+    def test_switch_command_works(self, runner, mock_get_config):
         """Test that explicit switch command works."""
-        runner = CliRunner()
-
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             mock_services = MockServices()
             mock_create_services.return_value = mock_services
@@ -110,15 +123,11 @@ class TestCLIRouting:
             switch_cmd = args[0]
             assert switch_cmd.branch == "feature-branch"
 
-    def test_branch_name_fallback(self):
+    def test_branch_name_fallback(self, runner, mock_get_config):
         """Test that unknown commands are treated as branch names."""
-        runner = CliRunner()
-
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             mock_services = MockServices()
             mock_create_services.return_value = mock_services
@@ -147,15 +156,11 @@ class TestCLIRouting:
             switch_cmd = args[0]
             assert switch_cmd.branch == "steve/bugfix"
 
-    def test_terminal_option_passed_through(self):
+    def test_terminal_option_passed_through(self, runner, mock_get_config):
         """Test that --terminal option is passed to checkout function."""
-        runner = CliRunner()
-
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             mock_services = MockServices()
             mock_create_services.return_value = mock_services
@@ -182,10 +187,8 @@ class TestCLIRouting:
             assert switch_cmd.branch == "feature-branch"
             assert switch_cmd.terminal_mode.value == "tab"
 
-    def test_no_args_shows_list(self):
+    def test_no_args_shows_list(self, runner):
         """Test that running with no arguments shows the worktree list."""
-        runner = CliRunner()
-
         with (
             patch("autowt.cli.list_worktrees") as mock_ls,
             patch("autowt.cli.create_services") as mock_create_services,
@@ -197,50 +200,30 @@ class TestCLIRouting:
             assert result.exit_code == 0
             mock_ls.assert_called_once()
 
-    def test_help_works(self):
+    def test_help_works(self, help_outputs):
         """Test that help commands work correctly."""
-        runner = CliRunner()
-
         # Main help
-        result = runner.invoke(main, ["--help"])
-        assert result.exit_code == 0
-        assert "Git worktree manager" in result.output
+        assert "Git worktree manager" in help_outputs("--help")
 
         # Subcommand help
-        result = runner.invoke(main, ["switch", "--help"])
-        assert result.exit_code == 0
-        assert "Switch to or create a worktree" in result.output
+        assert "Switch to or create a worktree" in help_outputs("switch", "--help")
 
         # Cleanup help
-        result = runner.invoke(main, ["cleanup", "--help"])
-        assert result.exit_code == 0
-        assert "Remove specific worktrees" in result.output
-        assert "Can optionally specify worktrees" in result.output
+        cleanup_help = help_outputs("cleanup", "--help")
+        assert "Remove specific worktrees" in cleanup_help
+        assert "Can optionally specify worktrees" in cleanup_help
 
-    def test_main_help_shows_builtin_command_aliases(self):
+    def test_main_help_shows_builtin_command_aliases(self, help_outputs):
         """Test that main --help includes built-in command aliases."""
-        runner = CliRunner()
-
-        with (
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
-        ):
-            mock_get_config.return_value = create_mock_config()
-
-            result = runner.invoke(main, ["--help"])
-            assert result.exit_code == 0
-            assert (
-                "cleanup (cl, clean, prune, rm, remove, del, delete)" in result.output
-            )
-            assert "Remove specific worktrees" in result.output
-            assert "config (configure, settings, cfg, conf)" in result.output
-            assert "ls (list, ll)" in result.output
-            assert "switch (sw, checkout, co, goto, go)" in result.output
-
-    def test_debug_flag_works(self):
+        output = help_outputs("--help")
+        assert "cleanup (cl, clean, prune, rm, remove, del, delete)" in output
+        assert "Remove specific worktrees" in output
+        assert "config (configure, settings, cfg, conf)" in output
+        assert "ls (list, ll)" in output
+        assert "switch (sw, checkout, co, goto, go)" in output
+
+    def test_debug_flag_works(self, runner):
         """Test that debug flag is handled correctly."""
-        runner = CliRunner()
-
         with (
             patch("autowt.cli.setup_logging") as mock_setup_logging,
             patch("autowt.cli.list_worktrees"),
@@ -265,15 +248,11 @@ class TestCLIRouting:
             assert mock_setup_logging.call_count == 2
             mock_setup_logging.assert_any_call(False)
 
-    def test_cleanup_mode_options(self):
+    def test_cleanup_mode_options(self, runner, mock_get_config):
         """Test that cleanup mode options work correctly."""
-        runner = CliRunner()
-
         with (
             patch("autowt.cli.cleanup_worktrees") as mock_cleanup,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             mock_services = MockServices()
             mock_create_services.return_value = mock_services
@@ -297,15 +276,11 @@ class TestCLIRouting:
                 assert cleanup_cmd.mode == mode_enum
                 mock_cleanup.reset_mock()
 
-    def test_complex_branch_names(self):
+    def test_complex_branch_names(self, runner, mock_get_config):
         """Test that complex branch names work as fallback."""
-        runner = CliRunner()
-
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             mock_services = MockServices()
             mock_create_services.return_value = mock_services
@@ -330,15 +305,11 @@ class TestCLIRouting:
                 assert switch_cmd.branch == branch_name
                 mock_checkout.reset_mock()
 
-    def test_reserved_words_as_branch_names(self):
+    def test_reserved_words_as_branch_names(self, runner, mock_get_config):
         """Test handling of reserved command names as branch names using switch."""
-        runner = CliRunner()
-
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             mock_services = MockServices()
             mock_create_services.return_value = mock_services
@@ -362,10 +333,8 @@ class TestCLIRouting:
 class TestCustomScriptCommands:
     """Tests for elevated custom scripts as first-class commands."""
 
-    def test_custom_script_recognized_as_command(self):
+    def test_custom_script_recognized_as_command(self, runner, mock_get_config):
         """Test that a custom script name is recognized as a command."""
-        runner = CliRunner()
-
         custom_scripts = {
             "ghllm": CustomScript(
                 branch_name="gh issue view $1 --json title -q .title",
@@ -376,8 +345,6 @@ class TestCustomScriptCommands:
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
             patch("autowt.cli.resolve_custom_script") as mock_resolve,
         ):
             mock_create_services.return_value = MockServices()
@@ -404,17 +371,13 @@ class TestCustomScriptCommands:
             assert switch_cmd.custom_script == "ghllm 123"
             assert switch_cmd.custom_script_name == "ghllm"
 
-    def test_custom_script_with_simple_format(self):
+    def test_custom_script_with_simple_format(self, runner, mock_get_config):
         """Test simple format custom script uses first arg as branch."""
-        runner = CliRunner()
-
         custom_scripts = {"bugfix": CustomScript(session_init='claude "Fix issue $1"')}
 
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
             patch("autowt.cli.resolve_custom_script") as mock_resolve,
         ):
             mock_create_services.return_value = MockServices()
@@ -434,16 +397,12 @@ class TestCustomScriptCommands:
             assert switch_cmd.branch == "456"
             assert switch_cmd.custom_script == "bugfix 456"
 
-    def test_simple_format_requires_branch_arg(self):
+    def test_simple_format_requires_branch_arg(self, runner, mock_get_config):
         """Test that simple format custom script errors without branch arg."""
-        runner = CliRunner()
-
         custom_scripts = {"bugfix": CustomScript(session_init='claude "Fix issue $1"')}
 
         with (
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
             patch("autowt.cli.resolve_custom_script") as mock_resolve,
         ):
             mock_create_services.return_value = MockServices()
@@ -455,17 +414,13 @@ class TestCustomScriptCommands:
             result = runner.invoke(main, ["bugfix"])
             assert "requires a branch name argument" in result.output
 
-    def test_builtin_commands_take_precedence(self):
+    def test_builtin_commands_take_precedence(self, runner, mock_get_config):
         """Test that built-in commands override custom scripts with same name."""
-        runner = CliRunner()
-
         custom_scripts = {"ls": CustomScript(session_init="echo This should not run")}
 
         with (
             patch("autowt.cli.list_worktrees") as mock_ls,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             mock_create_services.return_value = MockServices()
             mock_get_config.return_value = create_mock_config(
@@ -476,15 +431,11 @@ class TestCustomScriptCommands:
             assert result.exit_code == 0
             mock_ls.assert_called_once()
 
-    def test_branch_fallback_when_not_custom_script(self):
+    def test_branch_fallback_when_not_custom_script(self, runner, mock_get_config):
         """Test unknown commands still fallback to branch names."""
-        runner = CliRunner()
-
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             mock_create_services.return_value = MockServices()
             mock_get_config.return_value = create_mock_config()
@@ -497,17 +448,13 @@ class TestCustomScriptCommands:
             assert switch_cmd.branch == "feature-123"
             assert switch_cmd.custom_script is None
 
-    def test_custom_script_with_multiple_args(self):
+    def test_custom_script_with_multiple_args(self, runner, mock_get_config):
         """Test custom script with multiple arguments."""
-        runner = CliRunner()
-
         custom_scripts = {"multi": CustomScript(session_init='echo "$1 $2 $3"')}
 
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
             patch("autowt.cli.resolve_custom_script") as mock_resolve,
         ):
             mock_create_services.return_value = MockServices()
@@ -525,17 +472,13 @@ class TestCustomScriptCommands:
             assert switch_cmd.custom_script == "multi branch-name arg2 arg3"
             assert switch_cmd.branch == "branch-name"
 
-    def test_custom_script_with_options(self):
+    def test_custom_script_with_options(self, runner, mock_get_config):
         """Test custom script command accepts standard options."""
-        runner = CliRunner()
-
         custom_scripts = {"myfix": CustomScript(session_init='claude "Fix $1"')}
 
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
             patch("autowt.cli.resolve_custom_script") as mock_resolve,
         ):
             mock_create_services.return_value = MockServices()
@@ -557,10 +500,8 @@ class TestCustomScriptCommands:
 class TestCLIPriorityBehavior:
     """Tests for command resolution priority: builtins > custom scripts > branches."""
 
-    def test_priority_builtin_over_custom_script(self):
+    def test_priority_builtin_over_custom_script(self, runner, mock_get_config):
         """Test that built-in commands take precedence over custom scripts."""
-        runner = CliRunner()
-
         custom_scripts = {
             "cleanup": CustomScript(session_init="echo This should not run")
         }
@@ -568,8 +509,6 @@ class TestCLIPriorityBehavior:
         with (
             patch("autowt.cli.cleanup_worktrees") as mock_cleanup,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
             patch("autowt.cli.is_interactive_terminal", return_value=True),
         ):
             mock_services = MockServices()
@@ -583,17 +522,13 @@ class TestCLIPriorityBehavior:
             assert result.exit_code == 0
             mock_cleanup.assert_called_once()
 
-    def test_priority_custom_script_over_branch(self):
+    def test_priority_custom_script_over_branch(self, runner, mock_get_config):
         """Test that custom scripts take precedence over branch names."""
-        runner = CliRunner()
-
         custom_scripts = {"feature": CustomScript(session_init='claude "New feature"')}
 
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
             patch("autowt.cli.resolve_custom_script") as mock_resolve,
         ):
             mock_create_services.return_value = MockServices()
@@ -613,15 +548,11 @@ class TestCLIPriorityBehavior:
             assert switch_cmd.custom_script == "feature 123"
             assert switch_cmd.branch == "123"
 
-    def test_priority_branch_when_no_custom_script(self):
+    def test_priority_branch_when_no_custom_script(self, runner, mock_get_config):
         """Test that branch names work when no matching custom script exists."""
-        runner = CliRunner()
-
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             mock_create_services.return_value = MockServices()
             mock_get_config.return_value = create_mock_config(
@@ -637,17 +568,13 @@ class TestCLIPriorityBehavior:
             assert switch_cmd.branch == "feature-xyz"
             assert switch_cmd.custom_script is None
 
-    def test_switch_command_bypasses_custom_script(self):
+    def test_switch_command_bypasses_custom_script(self, runner, mock_get_config):
         """Test that explicit 'switch' command can switch to branch with same name as custom script."""
-        runner = CliRunner()
-
         custom_scripts = {"myfeature": CustomScript(session_init="echo custom script")}
 
         with (
             patch("autowt.cli.checkout_branch") as mock_checkout,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             mock_create_services.return_value = MockServices()
             mock_get_config.return_value = create_mock_config(
@@ -663,17 +590,13 @@ class TestCLIPriorityBehavior:
             assert switch_cmd.branch == "myfeature"
             assert switch_cmd.custom_script is None
 
-    def test_all_command_aliases_take_precedence(self):
+    def test_all_command_aliases_take_precedence(self, runner, mock_get_config):
         """Test that command aliases also take precedence over custom scripts."""
-        runner = CliRunner()
-
         custom_scripts = {"ll": CustomScript(session_init="echo This should not run")}
 
         with (
             patch("autowt.cli.list_worktrees") as mock_ls,
             patch("autowt.cli.create_services") as mock_create_services,
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
         ):
             mock_create_services.return_value = MockServices()
             mock_get_config.return_value = create_mock_config(
@@ -688,10 +611,8 @@ class TestCLIPriorityBehavior:
 class TestCustomScriptHelpOutput:
     """Tests for custom scripts appearing in --help output."""
 
-    def test_custom_scripts_appear_in_main_help(self):
+    def test_custom_scripts_appear_in_main_help(self, runner, mock_get_config):
         """Test that custom scripts are listed in main --help output."""
-        runner = CliRunner()
-
         custom_scripts = {
             "ghissue": CustomScript(
                 description="Create worktree from GitHub issue",
@@ -700,24 +621,16 @@ class TestCustomScriptHelpOutput:
             "bugfix": CustomScript(session_init='claude "Fix $1"'),
         }
 
-        with (
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
-        ):
-            mock_get_config.return_value = create_mock_config(
-                custom_scripts=custom_scripts
-            )
+        mock_get_config.return_value = create_mock_config(custom_scripts=custom_scripts)
 
-            result = runner.invoke(main, ["--help"])
-            assert result.exit_code == 0
-            # Custom scripts should appear in the commands list
-            assert "ghissue" in result.output
-            assert "bugfix" in result.output
+        result = runner.invoke(main, ["--help"])
+        assert result.exit_code == 0
+        # Custom scripts should appear in the commands list
+        assert "ghissue" in result.output
+        assert "bugfix" in result.output
 
-    def test_custom_script_description_in_help(self):
+    def test_custom_script_description_in_help(self, runner, mock_get_config):
         """Test that custom script description is shown in help output."""
-        runner = CliRunner()
-
         custom_scripts = {
             "ghissue": CustomScript(
                 description="Create worktree from GitHub issue",
@@ -725,41 +638,27 @@ class TestCustomScriptHelpOutput:
             ),
         }
 
-        with (
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
-        ):
-            mock_get_config.return_value = create_mock_config(
-                custom_scripts=custom_scripts
-            )
+        mock_get_config.return_value = create_mock_config(custom_scripts=custom_scripts)
 
-            result = runner.invoke(main, ["--help"])
-            assert result.exit_code == 0
-            assert "Create worktree from GitHub issue" in result.output
+        result = runner.invoke(main, ["--help"])
+        assert result.exit_code == 0
+        assert "Create worktree from GitHub issue" in result.output
 
-    def test_custom_script_without_description_shows_default(self):
+    def test_custom_script_without_description_shows_default(
+        self, runner, mock_get_config
+    ):
         """Test that scripts without description show default help text."""
-        runner = CliRunner()
-
         custom_scripts = {"myfix": CustomScript(session_init='claude "Fix $1"')}
 
-        with (
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
-        ):
-            mock_get_config.return_value = create_mock_config(
-                custom_scripts=custom_scripts
-            )
+        mock_get_config.return_value = create_mock_config(custom_scripts=custom_scripts)
 
-            result = runner.invoke(main, ["--help"])
-            assert result.exit_code == 0
-            assert "myfix" in result.output
-            assert "Run custom script 'myfix'" in result.output
+        result = runner.invoke(main, ["--help"])
+        assert result.exit_code == 0
+        assert "myfix" in result.output
+        assert "Run custom script 'myfix'" in result.output
 
-    def test_custom_script_individual_help(self):
+    def test_custom_script_individual_help(self, runner, mock_get_config):
         """Test that custom script --help shows its description."""
-        runner = CliRunner()
-
         custom_scripts = {
             "ghissue": CustomScript(
                 description="Create worktree from GitHub issue",
@@ -767,22 +666,14 @@ class TestCustomScriptHelpOutput:
             ),
         }
 
-        with (
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
-        ):
-            mock_get_config.return_value = create_mock_config(
-                custom_scripts=custom_scripts
-            )
+        mock_get_config.return_value = create_mock_config(custom_scripts=custom_scripts)
 
-            result = runner.invoke(main, ["ghissue", "--help"])
-            assert result.exit_code == 0
-            assert "Create worktree from GitHub issue" in result.output
+        result = runner.invoke(main, ["ghissue", "--help"])
+        assert result.exit_code == 0
+        assert "Create worktree from GitHub issue" in result.output
 
-    def test_custom_scripts_in_separate_section(self):
+    def test_custom_scripts_in_separate_section(self, runner, mock_get_config):
         """Test that custom scripts appear in separate 'Custom Scripts:' section."""
-        runner = CliRunner()
-
         custom_scripts = {
             "ghissue": CustomScript(
                 description="Create worktree from GitHub issue",
@@ -790,23 +681,17 @@ class TestCustomScriptHelpOutput:
             ),
         }
 
-        with (
-            patch("autowt.cli.initialize_config"),
-            patch("autowt.cli.get_config") as mock_get_config,
-        ):
-            mock_get_config.return_value = create_mock_config(
-                custom_scripts=custom_scripts
-            )
+        mock_get_config.return_value = create_mock_config(custom_scripts=custom_scripts)
 
-            result = runner.invoke(main, ["--help"])
-            assert result.exit_code == 0
-            # Built-in commands should be in "Commands:" section
-            assert "Commands:" in result.output
-            assert "cleanup" in result.output
-            # Custom scripts should be in "Custom Scripts:" section
-            assert "Custom Scripts:" in result.output
-            assert "ghissue" in result.output
-            # Verify ordering: Commands section comes before Custom Scripts section
-            commands_idx = result.output.index("Commands:")
-            custom_idx = result.output.index("Custom Scripts:")
-            assert commands_idx < custom_idx
+        result = runner.invoke(main, ["--help"])
+        assert result.exit_code == 0
+        # Built-in commands should be in "Commands:" section
+        assert "Commands:" in result.output
+        assert "cleanup" in result.output
+        # Custom scripts should be in "Custom Scripts:" section
+        assert "Custom Scripts:" in result.output
+        assert "ghissue" in result.output
+        # Verify ordering: Commands section comes before Custom Scripts section
+        commands_idx = result.output.index("Commands:")
+        custom_idx = result.output.index("Custom Scripts:")
+        assert commands_idx < custom_idx
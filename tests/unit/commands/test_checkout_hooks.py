@@ -1,410 +1,255 @@
 """Tests for checkout command hook execution."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
-from autowt.commands.checkout import (
-    _create_new_worktree,
-    _run_hook_set,
-    checkout_branch,
-)
+import pytest
+
+from autowt.commands import checkout
 from autowt.config import Config, HookConfig, ScriptsConfig
 from autowt.hooks import HookType
 from autowt.models import SwitchCommand, TerminalMode
 from tests.helpers import assert_hook_called_with, assert_hooks_not_called
 
+WORKTREE_DIR = Path("/tmp/test-worktree")
+REPO_DIR = Path("/tmp/test-repo")
+BRANCH_NAME = "feature/test-branch"
+GLOBAL_POST_CREATE_HOOK = "echo 'global post_create'"
+
+# Opaque stand-ins for hook configs; extract_hook_scripts is patched, so the
+# tests only check that these are passed through unchanged.
+GLOBAL_HOOK_CONFIG = object()
+PROJECT_HOOK_CONFIG = object()
+
+
+# Config objects are frozen dataclasses, so one instance can be shared by every
+# test in the session instead of being rebuilt per test.
+@pytest.fixture(scope="session")
+def empty_config():
+    """Config with every option at its default."""
+    return Config()
+
+
+@pytest.fixture(scope="session")
+def global_post_create_config():
+    """Config whose only script is the global post_create hook."""
+    return Config(scripts=ScriptsConfig(post_create=GLOBAL_POST_CREATE_HOOK))
+
+
+def _no_hook_scripts(*args):
+    return [], []
+
+
+class _ExtractHookScriptsStub:
+    """Stand-in for extract_hook_scripts that records its arguments."""
+
+    def __init__(self):
+        self.return_value = ([], [])
+        self.calls = []
+
+    def __call__(self, *args):
+        self.calls.append(args)
+        return self.return_value
+
+
+@pytest.fixture
+def patched(monkeypatch):
+    """Replace extract_hook_scripts with a stub that returns no scripts.
+
+    Tests set ``patched.extract.return_value`` to supply hook scripts.
+    """
+    extract = _ExtractHookScriptsStub()
+    monkeypatch.setattr(checkout, "extract_hook_scripts", extract)
+    return SimpleNamespace(extract=extract)
+
+
+# Each hook type with the abort_on_failure value checkout passes for it
+HOOK_SETS = [
+    (HookType.PRE_CREATE, True),
+    (HookType.POST_CREATE, True),
+    (HookType.POST_CREATE_ASYNC, False),
+]
+BLOCKING_HOOK_TYPES = [HookType.PRE_CREATE, HookType.POST_CREATE]
+
 
 class TestCheckoutHooks:
     """Tests for hook execution during checkout."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.worktree_dir = Path("/tmp/test-worktree")
-        self.repo_dir = Path("/tmp/test-repo")
-        self.branch_name = "feature/test-branch"
-
-    def test_run_pre_create_hooks_with_scripts(self, mock_services):
-        """Test that pre_create hooks are executed when scripts are present."""
+    @pytest.mark.parametrize("hook_type,abort_on_failure", HOOK_SETS)
+    def test_run_hooks_with_scripts(
+        self, mock_services, patched, hook_type, abort_on_failure
+    ):
+        """Test that hooks are executed when scripts are present."""
         # Set up mock configuration
-        mock_global_config = MagicMock()
-        mock_project_config = MagicMock()
-        mock_services.state.global_hook_config = mock_global_config
-        mock_services.hooks.run_hooks_success = True
-
-        # Mock extract_hook_scripts to return test scripts
-        global_scripts = ["echo 'global pre_create'"]
-        project_scripts = ["echo 'project pre_create'"]
-
-        with patch(
-            "autowt.commands.checkout.extract_hook_scripts",
-            return_value=(global_scripts, project_scripts),
-        ) as mock_extract:
-            result = _run_hook_set(
-                mock_services,
-                HookType.PRE_CREATE,
-                self.worktree_dir,
-                self.repo_dir,
-                mock_project_config,
-                self.branch_name,
-                abort_on_failure=True,
-            )
-
-            assert result is True
-
-            # Verify extract_hook_scripts was called correctly
-            mock_extract.assert_called_once_with(
-                mock_global_config, mock_project_config, HookType.PRE_CREATE
-            )
-
-            # Verify hooks were called with correct parameters
-            assert_hook_called_with(
-                mock_services,
-                global_scripts,
-                project_scripts,
-                HookType.PRE_CREATE,
-                self.worktree_dir,
-                self.repo_dir,
-                self.branch_name,
-            )
-
-    def test_run_pre_create_hooks_no_scripts(self, mock_services):
-        """Test that function returns True when no pre_create scripts are present."""
-        mock_global_config = MagicMock()
-        mock_project_config = MagicMock()
-        mock_services.state.global_hook_config = mock_global_config
-
-        # Mock extract_hook_scripts to return empty scripts
-        with patch(
-            "autowt.commands.checkout.extract_hook_scripts", return_value=([], [])
-        ):
-            result = _run_hook_set(
-                mock_services,
-                HookType.PRE_CREATE,
-                self.worktree_dir,
-                self.repo_dir,
-                mock_project_config,
-                self.branch_name,
-                abort_on_failure=True,
-            )
-
-            assert result is True
-            assert_hooks_not_called(mock_services)
-
-    def test_run_pre_create_hooks_failure(self, mock_services):
+        mock_services.state.global_hook_config = GLOBAL_HOOK_CONFIG
+
+        global_scripts = [f"echo 'global {hook_type}'"]
+        project_scripts = [f"echo 'project {hook_type}'"]
+
+        patched.extract.return_value = (global_scripts, project_scripts)
+
+        result = checkout._run_hook_set(
+            mock_services,
+            hook_type,
+            WORKTREE_DIR,
+            REPO_DIR,
+            PROJECT_HOOK_CONFIG,
+            BRANCH_NAME,
+            abort_on_failure=abort_on_failure,
+        )
+
+        assert result is True
+
+        # Verify extract_hook_scripts was called correctly
+        assert patched.extract.calls == [
+            (GLOBAL_HOOK_CONFIG, PROJECT_HOOK_CONFIG, hook_type)
+        ]
+
+        # Verify hooks were called with correct parameters
+        assert_hook_called_with(
+            mock_services,
+            global_scripts,
+            project_scripts,
+            hook_type,
+            WORKTREE_DIR,
+            REPO_DIR,
+            BRANCH_NAME,
+        )
+
+    @pytest.mark.parametrize("hook_type,abort_on_failure", HOOK_SETS)
+    def test_run_hooks_no_scripts(
+        self, mock_services, monkeypatch, hook_type, abort_on_failure
+    ):
+        """Test that function returns True when no scripts are present."""
+        monkeypatch.setattr(checkout, "extract_hook_scripts", _no_hook_scripts)
+
+        result = checkout._run_hook_set(
+            mock_services,
+            hook_type,
+            WORKTREE_DIR,
+            REPO_DIR,
+            PROJECT_HOOK_CONFIG,
+            BRANCH_NAME,
+            abort_on_failure=abort_on_failure,
+        )
+
+        assert result is True
+        assert_hooks_not_called(mock_services)
+
+    @pytest.mark.parametrize("hook_type", BLOCKING_HOOK_TYPES)
+    def test_run_hooks_failure(self, mock_services, patched, hook_type):
         """Test that function returns False when hooks fail."""
-        mock_global_config = MagicMock()
-        mock_project_config = MagicMock()
-        mock_services.state.global_hook_config = mock_global_config
+        mock_services.state.global_hook_config = GLOBAL_HOOK_CONFIG
         mock_services.hooks.run_hooks_success = False  # Simulate failure
 
-        global_scripts = ["exit 1"]
-        project_scripts = []
+        patched.extract.return_value = (["exit 1"], [])
 
-        with patch(
-            "autowt.commands.checkout.extract_hook_scripts",
-            return_value=(global_scripts, project_scripts),
-        ):
-            result = _run_hook_set(
-                mock_services,
-                HookType.PRE_CREATE,
-                self.worktree_dir,
-                self.repo_dir,
-                mock_project_config,
-                self.branch_name,
-                abort_on_failure=True,
-            )
-
-            assert result is False
-            # Verify hooks were attempted
-            assert len(mock_services.hooks.run_hook_calls) == 1
-
-    def test_run_post_create_hooks_with_scripts(self, mock_services):
-        """Test that post_create hooks are executed when scripts are present."""
-        mock_global_config = MagicMock()
-        mock_project_config = MagicMock()
-        mock_services.state.global_hook_config = mock_global_config
-        mock_services.hooks.run_hooks_success = True
-
-        global_scripts = ["echo 'global post_create'"]
-        project_scripts = ["echo 'project post_create'"]
-
-        with patch(
-            "autowt.commands.checkout.extract_hook_scripts",
-            return_value=(global_scripts, project_scripts),
-        ) as mock_extract:
-            result = _run_hook_set(
-                mock_services,
-                HookType.POST_CREATE,
-                self.worktree_dir,
-                self.repo_dir,
-                mock_project_config,
-                self.branch_name,
-                abort_on_failure=True,
-            )
-
-            assert result is True
-
-            mock_extract.assert_called_once_with(
-                mock_global_config, mock_project_config, HookType.POST_CREATE
-            )
-
-            assert_hook_called_with(
-                mock_services,
-                global_scripts,
-                project_scripts,
-                HookType.POST_CREATE,
-                self.worktree_dir,
-                self.repo_dir,
-                self.branch_name,
-            )
-
-    def test_run_post_create_hooks_no_scripts(self, mock_services):
-        """Test that function returns True when no post_create scripts are present."""
-        mock_global_config = MagicMock()
-        mock_project_config = MagicMock()
-        mock_services.state.global_hook_config = mock_global_config
-
-        with patch(
-            "autowt.commands.checkout.extract_hook_scripts", return_value=([], [])
-        ):
-            result = _run_hook_set(
-                mock_services,
-                HookType.POST_CREATE,
-                self.worktree_dir,
-                self.repo_dir,
-                mock_project_config,
-                self.branch_name,
-                abort_on_failure=True,
-            )
-
-            assert result is True
-            assert_hooks_not_called(mock_services)
-
-    def test_run_post_create_hooks_failure(self, mock_services):
-        """Test that function returns False when hooks fail."""
-        mock_global_config = MagicMock()
-        mock_project_config = MagicMock()
-        mock_services.state.global_hook_config = mock_global_config
-        mock_services.hooks.run_hooks_success = False
+        result = checkout._run_hook_set(
+            mock_services,
+            hook_type,
+            WORKTREE_DIR,
+            REPO_DIR,
+            PROJECT_HOOK_CONFIG,
+            BRANCH_NAME,
+            abort_on_failure=True,
+        )
 
-        global_scripts = ["exit 1"]
-        project_scripts = []
+        assert result is False
+        # Verify hooks were attempted
+        assert len(mock_services.hooks.run_hook_calls) == 1
 
-        with patch(
-            "autowt.commands.checkout.extract_hook_scripts",
-            return_value=(global_scripts, project_scripts),
-        ):
-            result = _run_hook_set(
-                mock_services,
-                HookType.POST_CREATE,
-                self.worktree_dir,
-                self.repo_dir,
-                mock_project_config,
-                self.branch_name,
-                abort_on_failure=True,
-            )
-
-            assert result is False
-            assert len(mock_services.hooks.run_hook_calls) == 1
-
-    def test_post_create_hooks_working_directory(self, mock_services):
+    @pytest.mark.parametrize(
+        "hook_type,abort_on_failure",
+        [(HookType.POST_CREATE, True), (HookType.POST_CREATE_ASYNC, False)],
+    )
+    def test_post_create_hooks_working_directory(
+        self, mock_services, patched, hook_type, abort_on_failure
+    ):
         """Test that post_create hooks run in the worktree directory."""
-        mock_global_config = MagicMock()
-        mock_project_config = MagicMock()
-        mock_services.state.global_hook_config = mock_global_config
-        mock_services.hooks.run_hooks_success = True
-
-        global_scripts = ["pwd > working_dir.txt"]
-        project_scripts = []
+        mock_services.state.global_hook_config = GLOBAL_HOOK_CONFIG
+
+        patched.extract.return_value = (["pwd"], [])
+
+        checkout._run_hook_set(
+            mock_services,
+            hook_type,
+            WORKTREE_DIR,
+            REPO_DIR,
+            PROJECT_HOOK_CONFIG,
+            BRANCH_NAME,
+            abort_on_failure=abort_on_failure,
+        )
 
-        with patch(
-            "autowt.commands.checkout.extract_hook_scripts",
-            return_value=(global_scripts, project_scripts),
-        ):
-            _run_hook_set(
-                mock_services,
-                HookType.POST_CREATE,
-                self.worktree_dir,
-                self.repo_dir,
-                mock_project_config,
-                self.branch_name,
-                abort_on_failure=True,
-            )
-
-            # Verify the working directory passed to hooks is the worktree directory
-            call_args = mock_services.hooks.run_hook_calls[0]
-            assert (
-                call_args[2] == self.worktree_dir
-            )  # worktree_dir is index 2 in run_hook
+        # Verify the working directory passed to hooks is the worktree directory
+        call_args = mock_services.hooks.run_hook_calls[0]
+        assert call_args[2] == WORKTREE_DIR  # worktree_dir is index 2 in run_hook
 
 
 class TestPostCreateAsyncHooks:
     """Tests for post_create_async hook execution."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.worktree_dir = Path("/tmp/test-worktree")
-        self.repo_dir = Path("/tmp/test-repo")
-        self.branch_name = "feature/test-branch"
-
-    def test_run_post_create_async_hooks_with_scripts(self, mock_services):
-        """Test that post_create_async hooks are executed when scripts are present."""
-        mock_global_config = MagicMock()
-        mock_project_config = MagicMock()
-        mock_services.state.global_hook_config = mock_global_config
-        mock_services.hooks.run_hooks_success = True
-
-        global_scripts = ["npm install"]
-        project_scripts = ["poetry install"]
-
-        with patch(
-            "autowt.commands.checkout.extract_hook_scripts",
-            return_value=(global_scripts, project_scripts),
-        ):
-            _run_hook_set(
-                mock_services,
-                HookType.POST_CREATE_ASYNC,
-                self.worktree_dir,
-                self.repo_dir,
-                mock_project_config,
-                self.branch_name,
-                abort_on_failure=False,
-            )
-
-            # Verify hooks were called
-            assert_hook_called_with(
-                mock_services,
-                global_scripts,
-                project_scripts,
-                HookType.POST_CREATE_ASYNC,
-                self.worktree_dir,
-                self.repo_dir,
-                self.branch_name,
-            )
-
-    def test_run_post_create_async_hooks_no_scripts(self, mock_services):
-        """Test that function does nothing when no post_create_async scripts are present."""
-        mock_global_config = MagicMock()
-        mock_project_config = MagicMock()
-        mock_services.state.global_hook_config = mock_global_config
-
-        with patch(
-            "autowt.commands.checkout.extract_hook_scripts", return_value=([], [])
-        ):
-            _run_hook_set(
-                mock_services,
-                HookType.POST_CREATE_ASYNC,
-                self.worktree_dir,
-                self.repo_dir,
-                mock_project_config,
-                self.branch_name,
-                abort_on_failure=False,
-            )
-
-            assert_hooks_not_called(mock_services)
-
     def test_run_post_create_async_hooks_failure_shows_warning(
-        self, mock_services, capsys
+        self, mock_services, patched, monkeypatch
     ):
         """Test that function shows warning but continues when hooks fail."""
-        mock_global_config = MagicMock()
-        mock_project_config = MagicMock()
-        mock_services.state.global_hook_config = mock_global_config
+        mock_services.state.global_hook_config = GLOBAL_HOOK_CONFIG
         mock_services.hooks.run_hooks_success = False  # Simulate failure
 
         global_scripts = ["exit 1"]
         project_scripts = []
 
-        with patch(
-            "autowt.commands.checkout.extract_hook_scripts",
-            return_value=(global_scripts, project_scripts),
-        ):
-            # Should not raise exception
-            _run_hook_set(
-                mock_services,
-                HookType.POST_CREATE_ASYNC,
-                self.worktree_dir,
-                self.repo_dir,
-                mock_project_config,
-                self.branch_name,
-                abort_on_failure=False,
-            )
-
-            # Verify hooks were called despite failure
-            assert len(mock_services.hooks.run_hook_calls) == 1
-
-            # Verify warning message was printed
-            captured = capsys.readouterr()
-            assert "Warning" in captured.out or "Warning" in captured.err
-
-    def test_post_create_async_hooks_working_directory(self, mock_services):
-        """Test that post_create_async hooks run in the worktree directory."""
-        mock_global_config = MagicMock()
-        mock_project_config = MagicMock()
-        mock_services.state.global_hook_config = mock_global_config
-        mock_services.hooks.run_hooks_success = True
-
-        global_scripts = ["pwd"]
-        project_scripts = []
+        patched.extract.return_value = (global_scripts, project_scripts)
+        printed = []
+        monkeypatch.setattr(checkout, "print_info", printed.append)
+
+        # Should not raise exception
+        checkout._run_hook_set(
+            mock_services,
+            HookType.POST_CREATE_ASYNC,
+            WORKTREE_DIR,
+            REPO_DIR,
+            PROJECT_HOOK_CONFIG,
+            BRANCH_NAME,
+            abort_on_failure=False,
+        )
 
-        with patch(
-            "autowt.commands.checkout.extract_hook_scripts",
-            return_value=(global_scripts, project_scripts),
-        ):
-            _run_hook_set(
-                mock_services,
-                HookType.POST_CREATE_ASYNC,
-                self.worktree_dir,
-                self.repo_dir,
-                mock_project_config,
-                self.branch_name,
-                abort_on_failure=False,
-            )
-
-            # Verify the working directory passed to hooks is the worktree directory
-            call_args = mock_services.hooks.run_hook_calls[0]
-            assert (
-                call_args[2] == self.worktree_dir
-            )  # worktree_dir is index 2 in run_hook
-
-
-class TestPostCreateAsyncTiming:
-    """Integration tests for post_create_async hook timing in checkout flow."""
-
-    def test_echo_mode_runs_async_before_switch(self):
-        """Test that ECHO mode is categorized to run async hooks before switch."""
-        # ECHO mode should run post_create_async before switch
-        assert TerminalMode.ECHO in (TerminalMode.ECHO, TerminalMode.INPLACE)
-
-    def test_tab_mode_runs_async_after_switch(self):
-        """Test that TAB mode is categorized to run async hooks after switch."""
-        # TAB mode should run post_create_async after switch
-        assert TerminalMode.TAB not in (TerminalMode.ECHO, TerminalMode.INPLACE)
-
-    def test_inplace_mode_runs_async_before_switch(self):
-        """Test that INPLACE mode is categorized to run async hooks before switch."""
-        # INPLACE mode should run post_create_async before switch
-        assert TerminalMode.INPLACE in (TerminalMode.ECHO, TerminalMode.INPLACE)
+        # Verify hooks were called despite failure
+        assert len(mock_services.hooks.run_hook_calls) == 1
+
+        # Verify warning message was printed
+        assert printed[-1] == (
+            f"Warning: {HookType.POST_CREATE_ASYNC} hook failed, but continuing anyway"
+        )
+
+
+@pytest.mark.parametrize(
+    "mode,expected",
+    [
+        (TerminalMode.ECHO, True),
+        (TerminalMode.INPLACE, True),
+        (TerminalMode.TAB, False),
+    ],
+)
+def test_post_create_async_timing(mode, expected):
+    """Test that only non-switching modes run async hooks before the switch."""
+    assert (mode in checkout.EARLY_ASYNC_MODES) is expected
 
 
 class TestHookConfigSelection:
     """Regression tests for separating merged and project-only hook config."""
 
     def test_create_new_worktree_does_not_duplicate_inherited_global_hooks(
-        self, mock_services, temp_repo_path
+        self, mock_services, temp_repo_path, global_post_create_config, monkeypatch
     ):
         repo_dir = temp_repo_path
         worktree_dir = temp_repo_path.parent / "test-repo-worktrees" / "feature-test"
         branch_name = "feature/test"
-        global_hook = "echo 'global post_create'"
+        global_hook = GLOBAL_POST_CREATE_HOOK
 
         mock_services.git.repo_root = repo_dir
         mock_services.state.global_hook_config = HookConfig(post_create=global_hook)
-        mock_services.state.configs["default"] = Config(
-            scripts=ScriptsConfig(post_create=global_hook)
-        )
+        mock_services.state.configs["default"] = global_post_create_config
         mock_services.state.project_hook_configs[str(repo_dir)] = HookConfig()
-        mock_services.hooks.run_hooks_success = True
 
         switch_cmd = SwitchCommand(
             branch=branch_name,
@@ -412,17 +257,16 @@ class TestHookConfigSelection:
             auto_confirm=True,
         )
 
-        with patch(
-            "autowt.commands.checkout._generate_worktree_path",
-            return_value=worktree_dir,
-        ):
-            _create_new_worktree(
-                mock_services,
-                switch_cmd,
-                repo_dir,
-                TerminalMode.ECHO,
-                HookConfig(),
-            )
+        monkeypatch.setattr(
+            checkout, "_generate_worktree_path", lambda *args: worktree_dir
+        )
+        checkout._create_new_worktree(
+            mock_services,
+            switch_cmd,
+            repo_dir,
+            TerminalMode.ECHO,
+            HookConfig(),
+        )
 
         scripts_run = [call[0] for call in mock_services.hooks.run_hook_calls]
         assert scripts_run.count(global_hook) == 1
@@ -431,13 +275,16 @@ class TestHookConfigSelection:
 class TestCheckoutNullBranch:
     """Tests for checkout handling of None branch (dynamic resolution)."""
 
-    def test_null_branch_error_when_not_resolved(self, mock_services, capsys):
+    def test_null_branch_error_when_not_resolved(
+        self, mock_services, empty_config, monkeypatch, capsys
+    ):
         """Test that None branch errors when custom script doesn't resolve it."""
         # Set up mock services
-        mock_services.git.repo_root = Path("/tmp/test-repo")
-        mock_services.state.configs["default"] = MagicMock()
-        mock_services.state.project_configs["/tmp/test-repo"] = MagicMock()
-        mock_services.state.project_configs["/tmp/test-repo"].session_init = None
+        mock_services.git.repo_root = REPO_DIR
+        mock_services.state.configs["default"] = empty_config
+        mock_services.state.project_configs[str(REPO_DIR)] = SimpleNamespace(
+            session_init=None
+        )
 
         # Create switch command with None branch but NO custom_script to resolve it
         switch_cmd = SwitchCommand(
@@ -446,8 +293,8 @@ class TestCheckoutNullBranch:
             custom_script=None,  # No custom script to resolve dynamic branch
         )
 
-        with patch("autowt.commands.checkout.resolve_custom_script", return_value=None):
-            checkout_branch(switch_cmd, mock_services)
+        monkeypatch.setattr(checkout, "resolve_custom_script", lambda *args: None)
+        checkout.checkout_branch(switch_cmd, mock_services)
 
         captured = capsys.readouterr()
         assert "No branch name provided" in captured.out
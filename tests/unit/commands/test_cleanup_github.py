@@ -1,11 +1,14 @@
 """Tests for GitHub cleanup mode in cleanup command."""
 
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from autowt.commands.cleanup import cleanup_worktrees
 from autowt.models import BranchStatus, CleanupCommand, CleanupMode, WorktreeInfo
 
+# GitHub cleanup never reads the merged config, so an opaque sentinel suffices.
+UNUSED_CONFIG = object()
+
 
 class TestGitHubCleanupMode:
     """Tests for GitHub cleanup mode."""
@@ -18,7 +21,7 @@ class TestGitHubCleanupMode:
         # Create mock services
         mock_services = Mock()
         mock_services.git.find_repo_root.return_value = Path("/test/repo")
-        mock_services.state.load_config.return_value = Mock()
+        mock_services.state.load_config.return_value = UNUSED_CONFIG
 
         # Mock analyze_branches_for_cleanup to raise error
         mock_services.github.analyze_branches_for_cleanup.side_effect = RuntimeError(
@@ -35,7 +38,7 @@ class TestGitHubCleanupMode:
         assert "GitHub cleanup requires 'gh' CLI tool" in captured.out
         assert "https://cli.github.com/" in captured.out
 
-    def test_cleanup_github_mode_with_merged_and_open_prs(self, capsys):
+    def test_cleanup_github_mode_with_merged_and_open_prs(self, monkeypatch, capsys):
         """Test GitHub cleanup mode with a mix of merged and open PRs."""
         # Create cleanup command with GitHub mode
         cleanup_cmd = CleanupCommand(mode=CleanupMode.GITHUB)
@@ -43,7 +46,7 @@ class TestGitHubCleanupMode:
         # Create mock services
         mock_services = Mock()
         mock_services.git.find_repo_root.return_value = Path("/test/repo")
-        mock_services.state.load_config.return_value = Mock()
+        mock_services.state.load_config.return_value = UNUSED_CONFIG
         mock_services.git.fetch_branches.return_value = True
 
         # Mock worktrees
@@ -90,8 +93,8 @@ class TestGitHubCleanupMode:
         mock_services.github.analyze_branches_for_cleanup.return_value = github_statuses
 
         # Mock user confirmation
-        with patch("builtins.input", return_value="n"):  # User cancels
-            cleanup_worktrees(cleanup_cmd, mock_services)
+        monkeypatch.setattr("builtins.input", lambda prompt: "n")  # User cancels
+        cleanup_worktrees(cleanup_cmd, mock_services)
 
         # Check output
         captured = capsys.readouterr()
@@ -101,7 +104,7 @@ class TestGitHubCleanupMode:
         assert "Branches with open or no PRs (will be kept):" in captured.out
         assert "feature-open" in captured.out
 
-    def test_cleanup_github_mode_filters_uncommitted_changes(self, capsys):
+    def test_cleanup_github_mode_filters_uncommitted_changes(self, monkeypatch, capsys):
         """Test that GitHub cleanup mode filters out branches with uncommitted changes."""
         # Create cleanup command with GitHub mode
         cleanup_cmd = CleanupCommand(mode=CleanupMode.GITHUB, auto_confirm=True)
@@ -109,7 +112,7 @@ class TestGitHubCleanupMode:
         # Create mock services
         mock_services = Mock()
         mock_services.git.find_repo_root.return_value = Path("/test/repo")
-        mock_services.state.load_config.return_value = Mock()
+        mock_services.state.load_config.return_value = UNUSED_CONFIG
         mock_services.git.fetch_branches.return_value = True
 
         # Mock worktrees
@@ -150,8 +153,8 @@ class TestGitHubCleanupMode:
         mock_services.state.remove_session_id.return_value = None
 
         # Run cleanup with auto-confirm
-        with patch("builtins.input", return_value="y"):  # Mock confirmation
-            cleanup_worktrees(cleanup_cmd, mock_services)
+        monkeypatch.setattr("builtins.input", lambda prompt: "y")  # Mock confirmation
+        cleanup_worktrees(cleanup_cmd, mock_services)
 
         # Check output
         captured = capsys.readouterr()
@@ -169,7 +172,7 @@ class TestGitHubCleanupMode:
             elif removal_section and line.strip() == "":
                 break  # End of removal section
 
-    def test_cleanup_github_mode_dry_run(self, capsys):
+    def test_cleanup_github_mode_dry_run(self, monkeypatch, capsys):
         """Test GitHub cleanup mode with dry-run flag."""
         # Create cleanup command with GitHub mode and dry-run
         cleanup_cmd = CleanupCommand(
@@ -179,7 +182,7 @@ class TestGitHubCleanupMode:
         # Create mock services
         mock_services = Mock()
         mock_services.git.find_repo_root.return_value = Path("/test/repo")
-        mock_services.state.load_config.return_value = Mock()
+        mock_services.state.load_config.return_value = UNUSED_CONFIG
         mock_services.git.fetch_branches.return_value = True
 
         # Mock worktrees
@@ -207,8 +210,8 @@ class TestGitHubCleanupMode:
         mock_services.state.remove_session_id.return_value = None
 
         # Run cleanup with dry-run
-        with patch("builtins.input", return_value="y"):  # Mock confirmation
-            cleanup_worktrees(cleanup_cmd, mock_services)
+        monkeypatch.setattr("builtins.input", lambda prompt: "y")  # Mock confirmation
+        cleanup_worktrees(cleanup_cmd, mock_services)
 
         # Verify that remove_worktree was NOT called (dry-run)
         mock_services.git.remove_worktree.assert_not_called()
@@ -3,6 +3,8 @@
 import os
 from unittest.mock import patch
 
+import pytest
+
 from autowt.commands import checkout, cleanup, ls
 from autowt.models import (
     BranchStatus,
@@ -12,23 +14,21 @@ from autowt.models import (
     TerminalMode,
     WorktreeInfo,
 )
-from tests.fixtures.service_builders import (
-    MockServices,
-)
 
 
 class TestListCommand:
     """Tests for ls command."""
 
-    def test_ls_with_worktrees(self, temp_repo_path, sample_worktrees, capsys):
+    def test_ls_with_worktrees(
+        self, mock_services, temp_repo_path, sample_worktrees, capsys
+    ):
         """Test listing worktrees."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
 
         # Run command
-        ls.list_worktrees(services)
+        ls.list_worktrees(mock_services)
 
         # Check output
         captured = capsys.readouterr()
@@ -38,41 +38,40 @@ class TestListCommand:
         assert "bugfix" in captured.out
         assert "autowt <branch>" in captured.out
 
-    def test_ls_no_worktrees(self, temp_repo_path, capsys):
+    def test_ls_no_worktrees(self, mock_services, temp_repo_path, capsys):
         """Test listing when no worktrees exist."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = []
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = []
 
         # Run command
-        ls.list_worktrees(services)
+        ls.list_worktrees(mock_services)
 
         # Check output
         captured = capsys.readouterr()
         assert "No worktrees found." in captured.out
 
-    def test_ls_not_in_repo(self, capsys):
+    def test_ls_not_in_repo(self, mock_services, capsys):
         """Test ls when not in a git repository."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = None
+        mock_services.git.repo_root = None
 
         # Run command
-        ls.list_worktrees(services)
+        ls.list_worktrees(mock_services)
 
         # Check output
         captured = capsys.readouterr()
         assert "Error: Not in a git repository" in captured.out
 
-    def test_ls_marks_nested_worktree_as_current(self, temp_repo_path, capsys):
+    def test_ls_marks_nested_worktree_as_current(
+        self, mock_services, temp_repo_path, capsys
+    ):
         """Nested worktrees should win over parent repo path for current marker."""
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
+        mock_services.git.repo_root = temp_repo_path
         nested_worktree_path = (
             temp_repo_path / ".claude" / "worktrees" / "feature-nested"
         )
-        services.git.worktrees = [
+        mock_services.git.worktrees = [
             WorktreeInfo(
                 branch="main", path=temp_repo_path, is_current=False, is_primary=True
             ),
@@ -83,7 +82,7 @@ class TestListCommand:
             patch("pathlib.Path.cwd", return_value=nested_worktree_path / "src"),
             patch("shutil.get_terminal_size", return_value=os.terminal_size((220, 24))),
         ):
-            ls.list_worktrees(services)
+            ls.list_worktrees(mock_services)
 
         captured = capsys.readouterr()
         assert "feature-nested ←" in captured.out
@@ -93,38 +92,35 @@ class TestListCommand:
 class TestCheckoutCommand:
     """Tests for checkout command."""
 
-    def test_checkout_existing_worktree(self, temp_repo_path, sample_worktrees):
+    def test_checkout_existing_worktree(
+        self, monkeypatch, mock_services, temp_repo_path, sample_worktrees
+    ):
         """Test switching to existing worktree."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
 
         # Create SwitchCommand
         switch_cmd = SwitchCommand(branch="feature1", terminal_mode=TerminalMode.TAB)
 
         # Mock user input to confirm switch
-        with (
-            patch("builtins.input", return_value="y"),
-            patch("builtins.print"),
-        ):  # Suppress print output
-            checkout.checkout_branch(switch_cmd, services)
+        monkeypatch.setattr("builtins.input", lambda prompt: "y")
+        checkout.checkout_branch(switch_cmd, mock_services)
 
         # Verify terminal switching was called
-        assert len(services.terminal.switch_calls) == 1
-        call = services.terminal.switch_calls[0]
+        assert len(mock_services.terminal.switch_calls) == 1
+        call = mock_services.terminal.switch_calls[0]
         assert call[0] == sample_worktrees[0].path  # worktree path
         assert call[1] == TerminalMode.TAB  # terminal mode
         assert call[2] is None  # init script (session_id parameter removed)
 
     def test_checkout_already_in_worktree(
-        self, temp_repo_path, sample_worktrees, capsys
+        self, mock_services, temp_repo_path, sample_worktrees, capsys
     ):
         """Test trying to switch to a worktree you're already in."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
 
         # Create SwitchCommand for feature1
         switch_cmd = SwitchCommand(branch="feature1", terminal_mode=TerminalMode.TAB)
@@ -132,23 +128,22 @@ class TestCheckoutCommand:
         # Mock current working directory to be inside the feature1 worktree
         target_worktree = sample_worktrees[0]  # feature1 worktree
         with patch("pathlib.Path.cwd", return_value=target_worktree.path / "subdir"):
-            checkout.checkout_branch(switch_cmd, services)
+            checkout.checkout_branch(switch_cmd, mock_services)
 
         # Verify no terminal switching was attempted
-        assert len(services.terminal.switch_calls) == 0
+        assert len(mock_services.terminal.switch_calls) == 0
 
         # Check that appropriate message was printed
         captured = capsys.readouterr()
         assert "Already in feature1 worktree" in captured.out
 
     def test_checkout_main_from_nested_worktree_is_not_false_positive(
-        self, temp_repo_path
+        self, mock_services, temp_repo_path
     ):
         """Switching to main should not be blocked when inside a nested worktree."""
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
+        mock_services.git.repo_root = temp_repo_path
         nested_worktree_path = temp_repo_path / ".claude" / "worktrees" / "feature1"
-        services.git.worktrees = [
+        mock_services.git.worktrees = [
             WorktreeInfo(branch="main", path=temp_repo_path, is_primary=True),
             WorktreeInfo(branch="feature1", path=nested_worktree_path),
         ]
@@ -156,19 +151,18 @@ class TestCheckoutCommand:
         switch_cmd = SwitchCommand(branch="main", terminal_mode=TerminalMode.TAB)
 
         with patch("pathlib.Path.cwd", return_value=nested_worktree_path / "subdir"):
-            checkout.checkout_branch(switch_cmd, services)
+            checkout.checkout_branch(switch_cmd, mock_services)
 
-        assert len(services.terminal.switch_calls) == 1
-        assert services.terminal.switch_calls[0][0] == temp_repo_path
+        assert len(mock_services.terminal.switch_calls) == 1
+        assert mock_services.terminal.switch_calls[0][0] == temp_repo_path
 
-    def test_checkout_new_worktree(self, temp_repo_path):
+    def test_checkout_new_worktree(self, mock_services, temp_repo_path):
         """Test creating new worktree."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = []  # No existing worktrees
-        services.git.fetch_success = True
-        services.git.create_success = True
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = []  # No existing worktrees
+        mock_services.git.fetch_success = True
+        mock_services.git.create_success = True
 
         # Create SwitchCommand
         switch_cmd = SwitchCommand(
@@ -176,51 +170,51 @@ class TestCheckoutCommand:
         )
 
         # Run command
-        checkout.checkout_branch(switch_cmd, services)
+        checkout.checkout_branch(switch_cmd, mock_services)
 
         # Verify git operations
-        assert services.git.fetch_called
-        assert len(services.git.create_worktree_calls) == 1
+        assert mock_services.git.fetch_called
+        assert len(mock_services.git.create_worktree_calls) == 1
 
-        create_call = services.git.create_worktree_calls[0]
+        create_call = mock_services.git.create_worktree_calls[0]
         assert create_call[1] == "new-feature"  # branch name
 
         # Verify terminal switching
-        assert len(services.terminal.switch_calls) == 1
-        switch_call = services.terminal.switch_calls[0]
+        assert len(mock_services.terminal.switch_calls) == 1
+        switch_call = mock_services.terminal.switch_calls[0]
         assert switch_call[1] == TerminalMode.WINDOW
         assert switch_call[2] is None  # init script
 
         # State is no longer saved - worktree info is derived from git
 
-    def test_checkout_decline_switch(self, temp_repo_path, sample_worktrees):
+    def test_checkout_decline_switch(
+        self, mock_services, temp_repo_path, sample_worktrees
+    ):
         """Test declining to switch to existing worktree."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
-        services.terminal.switch_success = (
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
+        mock_services.terminal.switch_success = (
             False  # Simulate user declining/switch failure
         )
 
         # Create SwitchCommand
         switch_cmd = SwitchCommand(branch="feature1", terminal_mode=TerminalMode.TAB)
 
-        checkout.checkout_branch(switch_cmd, services)
+        checkout.checkout_branch(switch_cmd, mock_services)
 
         # Verify terminal service was called but returned False (declined/failed)
-        assert len(services.terminal.switch_calls) == 1
-        assert services.terminal.switch_calls[0][4] == "feature1"  # branch_name
-        assert not services.terminal.switch_calls[0][5]  # auto_confirm
+        assert len(mock_services.terminal.switch_calls) == 1
+        assert mock_services.terminal.switch_calls[0][4] == "feature1"  # branch_name
+        assert not mock_services.terminal.switch_calls[0][5]  # auto_confirm
 
     def test_checkout_existing_worktree_with_init_script(
-        self, temp_repo_path, sample_worktrees
+        self, monkeypatch, mock_services, temp_repo_path, sample_worktrees
     ):
         """Test switching to existing worktree with init script."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
 
         # Create SwitchCommand
         switch_cmd = SwitchCommand(
@@ -228,29 +222,27 @@ class TestCheckoutCommand:
         )
 
         # Mock user input to confirm switch
-        with (
-            patch("builtins.input", return_value="y"),
-            patch("builtins.print"),
-        ):
-            checkout.checkout_branch(switch_cmd, services)
+        monkeypatch.setattr("builtins.input", lambda prompt: "y")
+        checkout.checkout_branch(switch_cmd, mock_services)
 
         # Verify terminal switching was called WITHOUT init script (existing worktree)
-        assert len(services.terminal.switch_calls) == 1
-        call = services.terminal.switch_calls[0]
+        assert len(mock_services.terminal.switch_calls) == 1
+        call = mock_services.terminal.switch_calls[0]
         assert call[0] == sample_worktrees[0].path  # worktree path
         assert call[1] == TerminalMode.TAB  # terminal mode
         assert call[2] is None  # no init script for existing worktrees
         assert call[3] is None  # no after_init for existing worktrees
         assert call[4] == "feature1"  # branch name
 
-    def test_checkout_new_worktree_with_init_script(self, temp_repo_path):
+    def test_checkout_new_worktree_with_init_script(
+        self, mock_services, temp_repo_path
+    ):
         """Test creating new worktree with init script."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = []  # No existing worktrees
-        services.git.fetch_success = True
-        services.git.create_success = True
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = []  # No existing worktrees
+        mock_services.git.fetch_success = True
+        mock_services.git.create_success = True
 
         # Create SwitchCommand
         switch_cmd = SwitchCommand(
@@ -260,23 +252,22 @@ class TestCheckoutCommand:
         )
 
         # Run command
-        checkout.checkout_branch(switch_cmd, services)
+        checkout.checkout_branch(switch_cmd, mock_services)
 
         # Verify terminal switching was called WITH init script (new worktree)
-        assert len(services.terminal.switch_calls) == 1
-        call = services.terminal.switch_calls[0]
+        assert len(mock_services.terminal.switch_calls) == 1
+        call = mock_services.terminal.switch_calls[0]
         assert call[1] == TerminalMode.TAB  # terminal mode
         assert call[2] == "npm install"  # init script
         assert call[4] == "feature-with-init"  # branch name
 
-    def test_checkout_with_complex_init_script(self, temp_repo_path):
+    def test_checkout_with_complex_init_script(self, mock_services, temp_repo_path):
         """Test creating worktree with complex init script."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = []
-        services.git.fetch_success = True
-        services.git.create_success = True
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = []
+        mock_services.git.fetch_success = True
+        mock_services.git.create_success = True
 
         # Create SwitchCommand
         switch_cmd = SwitchCommand(
@@ -286,133 +277,103 @@ class TestCheckoutCommand:
         )
 
         # Run command
-        checkout.checkout_branch(switch_cmd, services)
+        checkout.checkout_branch(switch_cmd, mock_services)
 
         # Verify the complex init script was passed correctly
-        assert len(services.terminal.switch_calls) == 1
-        call = services.terminal.switch_calls[0]
+        assert len(mock_services.terminal.switch_calls) == 1
+        call = mock_services.terminal.switch_calls[0]
         assert call[2] == "echo 'Setting up...' && npm install && npm run build"
 
 
 class TestCleanupCommand:
     """Tests for cleanup command."""
 
-    def test_cleanup_all_mode(
-        self, temp_repo_path, sample_worktrees, sample_branch_statuses
+    @pytest.mark.parametrize(
+        "mode,expected_removed",
+        [
+            (CleanupMode.ALL, 3),
+            (CleanupMode.REMOTELESS, 2),
+            (CleanupMode.MERGED, 2),
+        ],
+    )
+    def test_cleanup_mode(
+        self,
+        monkeypatch,
+        mock_services,
+        temp_repo_path,
+        sample_worktrees,
+        sample_branch_statuses,
+        mode,
+        expected_removed,
     ):
-        """Test cleanup in all mode."""
+        """Test that each cleanup mode removes the matching worktrees."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
-        services.git.branch_statuses = sample_branch_statuses
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
+        mock_services.git.branch_statuses = sample_branch_statuses
 
-        # Mock user confirmation and print output
-        with (
-            patch("builtins.input", return_value="y"),
-            patch("builtins.print"),
-        ):  # Suppress print output
-            cleanup_cmd = CleanupCommand(mode=CleanupMode.ALL)
-            cleanup.cleanup_worktrees(cleanup_cmd, services)
+        # Mock user confirmation
+        monkeypatch.setattr("builtins.input", lambda prompt: "y")
+        cleanup_cmd = CleanupCommand(mode=mode)
+        cleanup.cleanup_worktrees(cleanup_cmd, mock_services)
 
         # Verify git operations
-        assert services.git.fetch_called
-        assert len(services.git.remove_worktree_calls) == len(sample_branch_statuses)
-
-    def test_cleanup_remoteless_mode(
-        self, temp_repo_path, sample_worktrees, sample_branch_statuses
-    ):
-        """Test cleanup in remoteless mode."""
-        # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
-        services.git.branch_statuses = sample_branch_statuses
-
-        # Mock user confirmation and print output
-        with (
-            patch("builtins.input", return_value="y"),
-            patch("builtins.print"),
-        ):  # Suppress print output
-            cleanup_cmd = CleanupCommand(mode=CleanupMode.REMOTELESS)
-            cleanup.cleanup_worktrees(cleanup_cmd, services)
-
-        # Verify git operations
-        assert services.git.fetch_called
-
-    def test_cleanup_merged_mode(
-        self, temp_repo_path, sample_worktrees, sample_branch_statuses
-    ):
-        """Test cleanup in merged mode."""
-        # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
-        services.git.branch_statuses = sample_branch_statuses
-
-        # Mock user confirmation and print output
-        with (
-            patch("builtins.input", return_value="y"),
-            patch("builtins.print"),
-        ):  # Suppress print output
-            cleanup_cmd = CleanupCommand(mode=CleanupMode.MERGED)
-            cleanup.cleanup_worktrees(cleanup_cmd, services)
-
-        # Verify git operations
-        assert services.git.fetch_called
+        assert mock_services.git.fetch_called
+        assert len(mock_services.git.remove_worktree_calls) == expected_removed
 
     def test_cleanup_with_processes(
-        self, temp_repo_path, sample_worktrees, sample_branch_statuses
+        self,
+        monkeypatch,
+        mock_services,
+        temp_repo_path,
+        sample_worktrees,
+        sample_branch_statuses,
     ):
         """Test cleanup with running processes."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
-        services.git.branch_statuses = sample_branch_statuses
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
+        mock_services.git.branch_statuses = sample_branch_statuses
 
-        # Mock user confirmation and print output
-        with (
-            patch("builtins.input", return_value="y"),
-            patch("builtins.print"),
-        ):  # Suppress print output
-            cleanup_cmd = CleanupCommand(mode=CleanupMode.ALL)
-            cleanup.cleanup_worktrees(cleanup_cmd, services)
+        # Mock user confirmation
+        monkeypatch.setattr("builtins.input", lambda prompt: "y")
+        cleanup_cmd = CleanupCommand(mode=CleanupMode.ALL)
+        cleanup.cleanup_worktrees(cleanup_cmd, mock_services)
 
         # Verify operations
-        assert services.git.fetch_called
+        assert mock_services.git.fetch_called
 
     def test_cleanup_cancel(
-        self, temp_repo_path, sample_worktrees, sample_branch_statuses
+        self,
+        monkeypatch,
+        mock_services,
+        temp_repo_path,
+        sample_worktrees,
+        sample_branch_statuses,
     ):
         """Test canceling cleanup."""
         # Setup mocks
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
-        services.git.branch_statuses = sample_branch_statuses
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
+        mock_services.git.branch_statuses = sample_branch_statuses
 
-        # Mock user cancellation and print output
-        with (
-            patch("builtins.input", return_value="n"),
-            patch("builtins.print"),
-        ):  # Suppress print output
-            cleanup_cmd = CleanupCommand(mode=CleanupMode.ALL)
-            cleanup.cleanup_worktrees(cleanup_cmd, services)
+        # Mock user cancellation
+        monkeypatch.setattr("builtins.input", lambda prompt: "n")
+        cleanup_cmd = CleanupCommand(mode=CleanupMode.ALL)
+        cleanup.cleanup_worktrees(cleanup_cmd, mock_services)
 
         # Verify no removal calls were made
-        assert len(services.git.remove_worktree_calls) == 0
+        assert len(mock_services.git.remove_worktree_calls) == 0
 
     def test_cleanup_no_branches_found_in_non_interactive_mode(
-        self, temp_repo_path, sample_worktrees, capsys
+        self, mock_services, temp_repo_path, sample_worktrees, capsys
     ):
         """Test that cleanup exits cleanly when no branches are found in non-TTY."""
         # Setup mocks - worktrees exist but none match cleanup criteria
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
         # Set branch statuses where none are merged (so MERGED mode finds nothing)
-        services.git.branch_statuses = [
+        mock_services.git.branch_statuses = [
             BranchStatus(
                 branch=wt.branch,
                 has_remote=True,
@@ -427,25 +388,24 @@ class TestCleanupCommand:
             "autowt.commands.cleanup.is_interactive_terminal", return_value=False
         ):
             cleanup_cmd = CleanupCommand(mode=CleanupMode.MERGED, auto_confirm=False)
-            cleanup.cleanup_worktrees(cleanup_cmd, services)
+            cleanup.cleanup_worktrees(cleanup_cmd, mock_services)
 
         # Verify it exited cleanly with appropriate message
         captured = capsys.readouterr()
         assert "No worktrees selected for cleanup" in captured.out
 
         # Verify no removal calls were made
-        assert len(services.git.remove_worktree_calls) == 0
+        assert len(mock_services.git.remove_worktree_calls) == 0
 
     def test_cleanup_no_branches_offers_interactive_mode_in_tty(
-        self, temp_repo_path, sample_worktrees, capsys
+        self, mock_services, temp_repo_path, sample_worktrees, capsys
     ):
         """Test that cleanup offers interactive mode when no branches found in TTY."""
         # Setup mocks - worktrees exist but none match cleanup criteria
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
         # Set branch statuses where none are merged
-        services.git.branch_statuses = [
+        mock_services.git.branch_statuses = [
             BranchStatus(
                 branch=wt.branch,
                 has_remote=True,
@@ -462,23 +422,22 @@ class TestCleanupCommand:
             patch("autowt.commands.cleanup.confirm_default_no", return_value=False),
         ):
             cleanup_cmd = CleanupCommand(mode=CleanupMode.MERGED, auto_confirm=False)
-            cleanup.cleanup_worktrees(cleanup_cmd, services)
+            cleanup.cleanup_worktrees(cleanup_cmd, mock_services)
 
         # Verify it prompted for interactive mode
         captured = capsys.readouterr()
         assert "No worktrees selected for cleanup" in captured.out
 
         # Verify no removal calls were made
-        assert len(services.git.remove_worktree_calls) == 0
+        assert len(mock_services.git.remove_worktree_calls) == 0
 
     def test_cleanup_no_branches_enters_interactive_mode_when_accepted(
-        self, temp_repo_path, sample_worktrees
+        self, mock_services, temp_repo_path, sample_worktrees
     ):
         """Test entering interactive mode when user accepts after no branches found."""
         # Setup mocks - no branches match the initial MERGED mode criteria
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
         # All branches have status but none are merged
         branch_statuses = [
             BranchStatus(
@@ -490,7 +449,7 @@ class TestCleanupCommand:
             )
             for wt in sample_worktrees
         ]
-        services.git.branch_statuses = branch_statuses
+        mock_services.git.branch_statuses = branch_statuses
 
         # Mock TTY and user accepting interactive mode
         with (
@@ -501,24 +460,22 @@ class TestCleanupCommand:
                 return_value=branch_statuses[:1],
             ),  # User selects one branch
             patch("builtins.input", return_value="y"),  # Confirm cleanup
-            patch("builtins.print"),  # Suppress output
         ):
             cleanup_cmd = CleanupCommand(mode=CleanupMode.MERGED, auto_confirm=False)
-            cleanup.cleanup_worktrees(cleanup_cmd, services)
+            cleanup.cleanup_worktrees(cleanup_cmd, mock_services)
 
         # Verify removal was called (interactive mode returned branches)
-        assert len(services.git.remove_worktree_calls) == 1
+        assert len(mock_services.git.remove_worktree_calls) == 1
 
     def test_cleanup_no_branches_skips_prompt_with_auto_confirm(
-        self, temp_repo_path, sample_worktrees, capsys
+        self, mock_services, temp_repo_path, sample_worktrees, capsys
     ):
         """Test that auto_confirm skips interactive mode prompt."""
         # Setup mocks - no branches to clean up
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
         # Set branch statuses where none are merged
-        services.git.branch_statuses = [
+        mock_services.git.branch_statuses = [
             BranchStatus(
                 branch=wt.branch,
                 has_remote=True,
@@ -535,7 +492,7 @@ class TestCleanupCommand:
             patch("autowt.commands.cleanup.confirm_default_no") as mock_confirm,
         ):
             cleanup_cmd = CleanupCommand(mode=CleanupMode.MERGED, auto_confirm=True)
-            cleanup.cleanup_worktrees(cleanup_cmd, services)
+            cleanup.cleanup_worktrees(cleanup_cmd, mock_services)
 
         # Verify prompt was NOT shown (confirm_default_no never called)
         mock_confirm.assert_not_called()
@@ -545,15 +502,14 @@ class TestCleanupCommand:
         assert "No worktrees selected for cleanup" in captured.out
 
     def test_cleanup_no_branches_skips_prompt_in_interactive_mode(
-        self, temp_repo_path, sample_worktrees, capsys
+        self, mock_services, temp_repo_path, sample_worktrees, capsys
     ):
         """Test that interactive mode doesn't prompt again when no branches."""
         # Setup mocks - no branches to clean up
-        services = MockServices()
-        services.git.repo_root = temp_repo_path
-        services.git.worktrees = sample_worktrees
+        mock_services.git.repo_root = temp_repo_path
+        mock_services.git.worktrees = sample_worktrees
         # Set branch statuses where none are merged
-        services.git.branch_statuses = [
+        mock_services.git.branch_statuses = [
             BranchStatus(
                 branch=wt.branch,
                 has_remote=True,
@@ -576,7 +532,7 @@ class TestCleanupCommand:
             cleanup_cmd = CleanupCommand(
                 mode=CleanupMode.INTERACTIVE, auto_confirm=False
             )
-            cleanup.cleanup_worktrees(cleanup_cmd, services)
+            cleanup.cleanup_worktrees(cleanup_cmd, mock_services)
 
         # Verify prompt was NOT shown
         mock_confirm.assert_not_called()
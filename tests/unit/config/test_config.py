@@ -1,6 +1,5 @@
 """Tests for the comprehensive configuration system."""
 
-import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -275,22 +274,22 @@ class TestConfigLoader:
             expected = Path.home() / "Library" / "Application Support" / "autowt"
             assert loader.app_dir == expected
 
-    def test_config_loader_default_app_dir_linux(self):
+    def test_config_loader_default_app_dir_linux(self, monkeypatch):
         """Test default app directory on Linux."""
         with patch("platform.system", return_value="Linux"):
-            with patch.dict(os.environ, {}, clear=True):
-                loader = ConfigLoader()
-                expected = Path.home() / ".config" / "autowt"
-                assert loader.app_dir == expected
+            monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+            loader = ConfigLoader()
+            expected = Path.home() / ".config" / "autowt"
+            assert loader.app_dir == expected
 
-    def test_config_loader_default_app_dir_linux_xdg(self):
+    def test_config_loader_default_app_dir_linux_xdg(self, monkeypatch):
         """Test default app directory on Linux with XDG_CONFIG_HOME."""
         with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.setenv("XDG_CONFIG_HOME", temp_dir)
             with patch("platform.system", return_value="Linux"):
-                with patch.dict(os.environ, {"XDG_CONFIG_HOME": temp_dir}):
-                    loader = ConfigLoader()
-                    expected = Path(temp_dir) / "autowt"
-                    assert loader.app_dir == expected
+                loader = ConfigLoader()
+                expected = Path(temp_dir) / "autowt"
+                assert loader.app_dir == expected
 
     def test_config_loader_default_app_dir_windows(self):
         """Test default app directory on Windows."""
@@ -429,7 +428,7 @@ class TestConfigLoader:
 
             assert config == HookConfig(post_create="echo global")
 
-    def test_environment_variables(self):
+    def test_environment_variables(self, monkeypatch):
         """Test loading configuration from environment variables."""
         with tempfile.TemporaryDirectory() as temp_dir:
             app_dir = Path(temp_dir)
@@ -444,16 +443,17 @@ class TestConfigLoader:
                 "AUTOWT_SCRIPTS_SESSION_INIT": "make setup",
             }
 
-            with patch.dict(os.environ, env_vars):
-                loader = ConfigLoader(app_dir=app_dir)
-                config = loader.load_config()
+            for key, value in env_vars.items():
+                monkeypatch.setenv(key, value)
+            loader = ConfigLoader(app_dir=app_dir)
+            config = loader.load_config()
 
-                assert config.terminal.mode == TerminalMode.WINDOW
-                assert config.terminal.always_new is True
-                assert config.cleanup.default_mode == CleanupMode.MERGED
-                assert config.worktree.auto_fetch is False
-                assert config.worktree.branch_prefix == "feature/"
-                assert config.scripts.session_init == "make setup"
+            assert config.terminal.mode == TerminalMode.WINDOW
+            assert config.terminal.always_new is True
+            assert config.cleanup.default_mode == CleanupMode.MERGED
+            assert config.worktree.auto_fetch is False
+            assert config.worktree.branch_prefix == "feature/"
+            assert config.scripts.session_init == "make setup"
 
     def test_cli_overrides(self):
         """Test CLI overrides."""
@@ -471,7 +471,7 @@ class TestConfigLoader:
             assert config.terminal.mode == TerminalMode.ECHO
             assert config.cleanup.default_mode == CleanupMode.ALL
 
-    def test_precedence_order(self):
+    def test_precedence_order(self, monkeypatch):
         """Test configuration precedence order."""
         with tempfile.TemporaryDirectory() as temp_dir:
             app_dir = Path(temp_dir)
@@ -506,19 +506,18 @@ class TestConfigLoader:
                 "scripts": {"init": "cli init"}  # Override init script again
             }
 
-            with patch.dict(os.environ, env_vars):
-                loader = ConfigLoader(app_dir=app_dir)
-                config = loader.load_config(
-                    project_dir=project_dir, cli_overrides=cli_overrides
-                )
+            for key, value in env_vars.items():
+                monkeypatch.setenv(key, value)
+            loader = ConfigLoader(app_dir=app_dir)
+            config = loader.load_config(
+                project_dir=project_dir, cli_overrides=cli_overrides
+            )
 
-                # Check precedence: CLI > env > project > global > defaults
-                assert config.terminal.mode == TerminalMode.WINDOW  # From project
-                assert config.terminal.always_new is True  # From environment
-                assert (
-                    config.cleanup.default_mode == CleanupMode.MERGED
-                )  # From environment
-                assert config.scripts.session_init == "cli init"  # From CLI override
+            # Check precedence: CLI > env > project > global > defaults
+            assert config.terminal.mode == TerminalMode.WINDOW  # From project
+            assert config.terminal.always_new is True  # From environment
+            assert config.cleanup.default_mode == CleanupMode.MERGED  # From environment
+            assert config.scripts.session_init == "cli init"  # From CLI override
 
     def test_invalid_global_config_file(self):
         """Test handling of invalid global config file."""
@@ -552,18 +551,18 @@ class TestConfigLoader:
             # Should fall back to defaults
             assert config.terminal.mode == TerminalMode.TAB
 
-    def test_unknown_environment_variable(self):
+    def test_unknown_environment_variable(self, monkeypatch):
         """Test handling of unknown environment variables."""
+        monkeypatch.setenv("AUTOWT_UNKNOWN_SETTING", "value")
         with tempfile.TemporaryDirectory() as temp_dir:
             app_dir = Path(temp_dir)
 
-            with patch.dict(os.environ, {"AUTOWT_UNKNOWN_SETTING": "value"}):
-                loader = ConfigLoader(app_dir=app_dir)
-                # Should not raise an exception, just log a warning
-                config = loader.load_config()
-                assert config.terminal.mode == TerminalMode.TAB
+            loader = ConfigLoader(app_dir=app_dir)
+            # Should not raise an exception, just log a warning
+            config = loader.load_config()
+            assert config.terminal.mode == TerminalMode.TAB
 
-    def test_environment_variable_type_conversion(self):
+    def test_environment_variable_type_conversion(self, monkeypatch):
         """Test environment variable type conversion."""
         with tempfile.TemporaryDirectory() as temp_dir:
             app_dir = Path(temp_dir)
@@ -574,13 +573,14 @@ class TestConfigLoader:
                 "AUTOWT_SCRIPTS_SESSION_INIT": "echo hello",  # String
             }
 
-            with patch.dict(os.environ, env_vars):
-                loader = ConfigLoader(app_dir=app_dir)
-                config = loader.load_config()
+            for key, value in env_vars.items():
+                monkeypatch.setenv(key, value)
+            loader = ConfigLoader(app_dir=app_dir)
+            config = loader.load_config()
 
-                assert config.terminal.always_new is True
-                assert config.cleanup.default_mode == CleanupMode.ALL
-                assert config.scripts.session_init == "echo hello"
+            assert config.terminal.always_new is True
+            assert config.cleanup.default_mode == CleanupMode.ALL
+            assert config.scripts.session_init == "echo hello"
 
     def test_save_config(self):
         """Test saving configuration to file."""
@@ -680,7 +680,7 @@ class TestGlobalConfigManagement:
 class TestConfigIntegration:
     """Integration tests for the complete configuration system."""
 
-    def test_real_world_config_loading(self):
+    def test_real_world_config_loading(self, monkeypatch):
         """Test loading a realistic configuration setup."""
         with tempfile.TemporaryDirectory() as temp_dir:
             app_dir = Path(temp_dir)
@@ -723,31 +723,32 @@ class TestConfigIntegration:
             # CLI overrides - one-time overrides
             cli_overrides = {"terminal": {"always_new": True}}
 
-            with patch.dict(os.environ, env_vars):
-                loader = ConfigLoader(app_dir=app_dir)
-                config = loader.load_config(
-                    project_dir=project_dir, cli_overrides=cli_overrides
-                )
+            for key, value in env_vars.items():
+                monkeypatch.setenv(key, value)
+            loader = ConfigLoader(app_dir=app_dir)
+            config = loader.load_config(
+                project_dir=project_dir, cli_overrides=cli_overrides
+            )
 
-                # Verify final configuration respects precedence
-                assert config.terminal.mode == TerminalMode.ECHO  # From env
-                assert config.terminal.always_new is True  # From CLI
-                assert config.terminal.program == "iterm2"  # From global
+            # Verify final configuration respects precedence
+            assert config.terminal.mode == TerminalMode.ECHO  # From env
+            assert config.terminal.always_new is True  # From CLI
+            assert config.terminal.program == "iterm2"  # From global
 
-                assert config.cleanup.default_mode == CleanupMode.MERGED  # From env
+            assert config.cleanup.default_mode == CleanupMode.MERGED  # From env
 
-                assert (
-                    config.scripts.session_init == "npm install && npm run setup"
-                )  # From project
-                assert len(config.scripts.custom) == 3  # From project
+            assert (
+                config.scripts.session_init == "npm install && npm run setup"
+            )  # From project
+            assert len(config.scripts.custom) == 3  # From project
 
-                assert (
-                    config.worktree.directory_pattern
-                    == "$HOME/work-trees/{repo_name}/{branch}"
-                )  # From project
-                assert config.worktree.auto_fetch is False  # From project
+            assert (
+                config.worktree.directory_pattern
+                == "$HOME/work-trees/{repo_name}/{branch}"
+            )  # From project
+            assert config.worktree.auto_fetch is False  # From project
 
-                assert config.confirmations.cleanup_multiple is False  # From global
+            assert config.confirmations.cleanup_multiple is False  # From global
 
     def test_minimal_config_setup(self):
         """Test that the system works with minimal configuration."""
@@ -6,7 +6,6 @@ import pytest
 
 from autowt.console import (
     AUTOWT_THEME,
-    console,
     print_command,
     print_error,
     print_info,
@@ -16,10 +15,15 @@ from autowt.console import (
     print_section,
     print_success,
 )
-from autowt.console import console as console2
 from autowt.global_config import options
 
 
+@pytest.fixture(scope="session")
+def theme_styles():
+    """Style table of the autowt theme, read once per session."""
+    return AUTOWT_THEME.styles
+
+
 @pytest.fixture
 def mock_console(monkeypatch):
     """Fixture to mock the console for all print function tests."""
@@ -31,7 +35,7 @@ def mock_console(monkeypatch):
 class TestConsoleTheme:
     """Test console theme configuration."""
 
-    def test_theme_has_expected_styles(self):
+    def test_theme_has_expected_styles(self, theme_styles):
         """Test that the theme contains all expected autowt styles."""
         expected_autowt_styles = {
             "command",
@@ -44,13 +48,12 @@ class TestConsoleTheme:
             "info",
         }
 
-        theme_styles = set(AUTOWT_THEME.styles.keys())
-        assert expected_autowt_styles.issubset(theme_styles)
+        assert expected_autowt_styles <= theme_styles.keys()
 
-    def test_command_and_output_use_same_style(self):
+    def test_command_and_output_use_same_style(self, theme_styles):
         """Test that command and output styles are both gray."""
-        command_style = AUTOWT_THEME.styles["command"]
-        output_style = AUTOWT_THEME.styles["output"]
+        command_style = theme_styles["command"]
+        output_style = theme_styles["output"]
         assert command_style == output_style
         assert str(command_style) == "dim grey50"
 
@@ -90,34 +93,23 @@ class TestConsolePrintFunctions:
         function(input_text)
 
         expected_text, expected_kwargs = expected_call
-        if expected_kwargs:
-            mock_console.print.assert_called_once_with(expected_text, **expected_kwargs)
-        else:
-            mock_console.print.assert_called_once_with(expected_text)
+        assert mock_console.print.call_args_list == [
+            ((expected_text,), expected_kwargs)
+        ]
 
-    def test_output_suppression_when_enabled(self, mock_console):
-        """Test that rich output can be suppressed via global option."""
-        # Test normal output first
+    def test_output_not_suppressed_by_default(self, mock_console, monkeypatch):
+        """Test that rich output is printed when suppression is off."""
+        monkeypatch.setattr(options, "suppress_rich_output", False)
         print_info("Test info message")
-        mock_console.print.assert_called_with("Test info message", style="info")
-        mock_console.reset_mock()
-
-        # Test suppressed output
-        original_suppress = options.suppress_rich_output
-        options.suppress_rich_output = True
-        try:
-            print_info("Suppressed info")
-            print_success("Suppressed success")
-            print_error("Suppressed error")
-            # Should have no console.print calls when suppressed
-            mock_console.print.assert_not_called()
-        finally:
-            options.suppress_rich_output = original_suppress
-
-
-class TestConsoleIntegration:
-    """Test console integration with rich."""
-
-    def test_console_is_singleton(self):
-        """Test that console is a singleton instance."""
-        assert console is console2
+        assert mock_console.print.call_args_list == [
+            (("Test info message",), {"style": "info"})
+        ]
+
+    def test_output_suppression_when_enabled(self, mock_console, monkeypatch):
+        """Test that rich output can be suppressed via global option."""
+        monkeypatch.setattr(options, "suppress_rich_output", True)
+        print_info("Suppressed info")
+        print_success("Suppressed success")
+        print_error("Suppressed error")
+        # Should have no console.print calls when suppressed
+        mock_console.print.assert_not_called()
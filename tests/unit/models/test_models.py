@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from autowt.models import (
     BranchStatus,
     CleanupMode,
@@ -83,18 +85,21 @@ class TestSwitchCommand:
 class TestEnums:
     """Tests for enum values."""
 
-    def test_terminal_mode_values(self):
-        """Test TerminalMode enum values."""
-        assert TerminalMode.TAB.value == "tab"
-        assert TerminalMode.WINDOW.value == "window"
-        assert TerminalMode.INPLACE.value == "inplace"
-
-    def test_cleanup_mode_values(self):
-        """Test CleanupMode enum values."""
-        assert CleanupMode.ALL.value == "all"
-        assert CleanupMode.REMOTELESS.value == "remoteless"
-        assert CleanupMode.MERGED.value == "merged"
-        assert CleanupMode.INTERACTIVE.value == "interactive"
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (TerminalMode.TAB, "tab"),
+            (TerminalMode.WINDOW, "window"),
+            (TerminalMode.INPLACE, "inplace"),
+            (CleanupMode.ALL, "all"),
+            (CleanupMode.REMOTELESS, "remoteless"),
+            (CleanupMode.MERGED, "merged"),
+            (CleanupMode.INTERACTIVE, "interactive"),
+        ],
+    )
+    def test_enum_values(self, member, value):
+        """Test TerminalMode and CleanupMode enum values."""
+        assert member.value == value
 
 
 class TestCustomScript:
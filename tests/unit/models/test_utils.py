@@ -1,6 +1,24 @@
 """Tests for utility functions."""
 
-from autowt.utils import normalize_dynamic_branch_name, sanitize_branch_name
+import io
+import logging
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from autowt.utils import (
+    clear_command_cache,
+    command_logger,
+    normalize_dynamic_branch_name,
+    run_command_cached,
+    run_command_quiet_on_failure,
+    run_command_visible,
+    sanitize_branch_name,
+    setup_command_logging,
+)
 
 
 class TestSanitizeBranchName:
@@ -66,6 +84,17 @@ class TestSanitizeBranchName:
         )
         assert sanitize_branch_name("release/v2.1.0-rc1") == "release-v2.1.0-rc1"
 
+    def test_conventional_prefix_branch_names(self):
+        """Test that conventional type/name branches sanitize like any other."""
+        assert sanitize_branch_name("hotfix/login-crash") == "hotfix-login-crash"
+        assert sanitize_branch_name("chore/bump-deps.") == "chore-bump-deps"
+        assert sanitize_branch_name("feature/a/b") == "feature-a-b"
+
+    def test_non_ascii_branch_names(self):
+        """Test that non-ASCII letters are kept and symbols are dropped."""
+        assert sanitize_branch_name("café/crème") == "café-crème"
+        assert sanitize_branch_name("fix/naïve→bug") == "fix-naïvebug"
+
 
 class TestNormalizeDynamicBranchName:
     """Tests for dynamic branch name normalization."""
@@ -188,3 +217,155 @@ class TestNormalizeDynamicBranchName:
         assert len(result) == 254
         assert result == "a" * 254
         assert not result.endswith("-")
+
+
+# Successful run_command result; only these are memoized
+OK_RESULT = SimpleNamespace(returncode=0, stdout="out", stderr="")
+
+
+class TestRunCommandCached:
+    """Tests for memoized read-only command execution."""
+
+    def test_identical_calls_run_once(self):
+        """Test that repeated identical queries reuse the first result."""
+        with patch("autowt.utils.run_command", return_value=OK_RESULT) as mock_run:
+            first = run_command_cached(["git", "worktree", "list"], cwd=Path("/r"))
+            second = run_command_cached(["git", "worktree", "list"], cwd=Path("/r"))
+
+            assert first is second
+            mock_run.assert_called_once_with(
+                ["git", "worktree", "list"],
+                cwd=Path("/r"),
+                timeout=None,
+                description=None,
+            )
+
+    def test_cached_label_only_on_hit(self, monkeypatch):
+        """Test that only a reused result is logged as cached."""
+        messages = []
+        monkeypatch.setattr(
+            command_logger,
+            "debug",
+            lambda msg, *args: messages.append(msg % tuple(map(str, args))),
+        )
+        with patch("autowt.utils.run_command", return_value=OK_RESULT) as mock_run:
+            run_command_cached(["git", "remote"], description="List remotes")
+
+            assert messages == []
+            assert mock_run.call_args.kwargs["description"] == "List remotes"
+
+            run_command_cached(["git", "remote"], description="List remotes")
+
+        assert messages == ["List remotes (cached): git remote"]
+
+    def test_failed_command_is_rerun(self):
+        """Test that a non-zero exit is not cached."""
+        failed = SimpleNamespace(returncode=128, stdout="", stderr="index.lock")
+        with patch("autowt.utils.run_command", return_value=failed) as mock_run:
+            run_command_cached(["git", "worktree", "list"])
+            run_command_cached(["git", "worktree", "list"])
+
+            assert mock_run.call_count == 2
+
+    def test_different_cwd_is_not_shared(self):
+        """Test that the cache is keyed on the working directory."""
+        with patch("autowt.utils.run_command", return_value=OK_RESULT) as mock_run:
+            run_command_cached(["git", "worktree", "list"], cwd=Path("/a"))
+            run_command_cached(["git", "worktree", "list"], cwd=Path("/b"))
+
+            assert mock_run.call_count == 2
+
+    def test_clear_command_cache_forces_rerun(self):
+        """Test that clearing the cache makes the next query run again."""
+        with patch("autowt.utils.run_command", return_value=OK_RESULT) as mock_run:
+            run_command_cached(["git", "remote"])
+            clear_command_cache()
+            run_command_cached(["git", "remote"])
+
+            assert mock_run.call_count == 2
+
+    def test_visible_command_invalidates_cache(self):
+        """Test that state-changing commands drop cached query results."""
+        with (
+            patch("autowt.utils.run_command", return_value=OK_RESULT) as mock_run,
+            patch("autowt.utils.subprocess.run"),
+            patch("autowt.utils.print_command"),
+        ):
+            run_command_cached(["git", "worktree", "list"])
+            run_command_visible(["git", "worktree", "add", "wt", "branch"])
+            run_command_cached(["git", "worktree", "list"])
+
+            assert mock_run.call_count == 2
+
+
+class TestCommandOutputDecoding:
+    """Tests for single-pass decoding of captured command output."""
+
+    def test_text_output_is_decoded_as_utf8(self):
+        """Test that captured output is returned as UTF-8 text."""
+        result = run_command_quiet_on_failure(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.stdout.buffer.write('h\\u00e9'.encode())",
+            ]
+        )
+
+        assert result.stdout == "h\u00e9"
+
+    def test_undecodable_bytes_are_replaced(self):
+        """Test that invalid UTF-8 does not raise."""
+        result = run_command_quiet_on_failure(
+            [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'a\\xffb')"]
+        )
+
+        assert result.stdout == "a\ufffdb"
+
+    def test_newlines_are_translated(self):
+        """Test that CRLF output is normalized, as porcelain parsing expects."""
+        result = run_command_quiet_on_failure(
+            [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'a\\r\\nb')"]
+        )
+
+        assert result.stdout == "a\nb"
+
+    def test_bytes_returned_when_text_disabled(self):
+        """Test that text=False leaves output undecoded."""
+        result = run_command_quiet_on_failure(
+            [sys.executable, "-c", "print('raw', end='')"], text=False
+        )
+
+        assert result.stdout == b"raw"
+
+
+class TestSetupCommandLogging:
+    """Tests for command logger setup."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_command_logger(self, monkeypatch):
+        """Give each test a command logger with no handlers installed."""
+        monkeypatch.setattr(command_logger, "handlers", [])
+        monkeypatch.setattr(command_logger, "propagate", True)
+        monkeypatch.setattr(command_logger, "level", logging.NOTSET)
+
+    @pytest.mark.parametrize("isatty", [True, False])
+    def test_command_lines_keep_their_place_in_stderr(self, monkeypatch, isatty):
+        """Test that command records are written immediately, even when redirected.
+
+        The root logger writes to stderr unbuffered, so buffering command records
+        would move them after the service-level lines around them.
+        """
+        stderr = io.StringIO()
+        monkeypatch.setattr(stderr, "isatty", lambda: isatty)
+        monkeypatch.setattr(sys, "stderr", stderr)
+        setup_command_logging(debug=True)
+
+        command_logger.debug("Running: git status")
+        stderr.write("service line\n")
+        command_logger.debug("Command succeeded (exit code: 0)")
+
+        assert stderr.getvalue().splitlines() == [
+            "Running: git status",
+            "service line",
+            "Command succeeded (exit code: 0)",
+        ]
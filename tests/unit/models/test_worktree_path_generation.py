@@ -132,7 +132,7 @@ class TestWorktreePathGeneration:
         assert result_path == expected_path
         assert "my-awesome-project" in str(result_path)
 
-    def test_supports_environment_variables(self):
+    def test_supports_environment_variables(self, monkeypatch):
         """Test that environment variables like $HOME are expanded correctly."""
         repo_path = Path("/home/user/Code/www/myprojectroot/base-repo")
         branch = "test-branch"
@@ -159,10 +159,10 @@ class TestWorktreePathGeneration:
         )
         mock_services.git.list_worktrees.return_value = [mock_worktree]
 
+        monkeypatch.setenv("HOME", "/home/user")
         with (
             patch("autowt.commands.checkout.sanitize_branch_name", return_value=branch),
             patch("pathlib.Path.mkdir"),
-            patch.dict("os.environ", {"HOME": "/home/user"}),
         ):
             result_path = _generate_worktree_path(mock_services, repo_path, branch)
 
@@ -1,7 +1,8 @@
 """Tests for GitService remote detection and branch analysis."""
 
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from autowt.models import WorktreeInfo
 from autowt.services.git import GitCommands, GitService
@@ -19,9 +20,7 @@ class TestGitServiceRemoteDetection:
         """Test that _get_available_remotes returns empty list when no remotes exist."""
         with patch("autowt.services.git.run_command_quiet_on_failure") as mock_run:
             # Simulate no remotes (empty stdout)
-            mock_result = Mock()
-            mock_result.returncode = 0
-            mock_result.stdout = ""
+            mock_result = SimpleNamespace(returncode=0, stdout="")
             mock_run.return_value = mock_result
 
             remotes = self.git_service._get_available_remotes(self.repo_path)
@@ -38,9 +37,7 @@ class TestGitServiceRemoteDetection:
         """Test that _get_available_remotes returns origin when it exists."""
         with patch("autowt.services.git.run_command_quiet_on_failure") as mock_run:
             # Simulate origin remote
-            mock_result = Mock()
-            mock_result.returncode = 0
-            mock_result.stdout = "origin\n"
+            mock_result = SimpleNamespace(returncode=0, stdout="origin\n")
             mock_run.return_value = mock_result
 
             remotes = self.git_service._get_available_remotes(self.repo_path)
@@ -51,9 +48,9 @@ class TestGitServiceRemoteDetection:
         """Test that _get_available_remotes prioritizes origin and upstream."""
         with patch("autowt.services.git.run_command_quiet_on_failure") as mock_run:
             # Simulate multiple remotes with upstream and origin
-            mock_result = Mock()
-            mock_result.returncode = 0
-            mock_result.stdout = "fork\nupstream\norigin\nother\n"
+            mock_result = SimpleNamespace(
+                returncode=0, stdout="fork\nupstream\norigin\nother\n"
+            )
             mock_run.return_value = mock_result
 
             remotes = self.git_service._get_available_remotes(self.repo_path)
@@ -181,10 +178,11 @@ class TestGitServiceQuietFailure:
     def test_get_commit_hash_uses_quiet_failure(self):
         """Test that _get_commit_hash uses run_command_quiet_on_failure."""
         with patch("autowt.services.git.run_command_quiet_on_failure") as mock_run:
-            mock_result = Mock()
-            mock_result.returncode = 128  # Git error
-            mock_result.stdout = ""
-            mock_result.stderr = "fatal: ambiguous argument 'origin/master'"
+            mock_result = SimpleNamespace(
+                returncode=128,  # Git error
+                stdout="",
+                stderr="fatal: ambiguous argument 'origin/master'",
+            )
             mock_run.return_value = mock_result
 
             result = self.git_service._get_commit_hash(self.repo_path, "origin/master")
@@ -200,10 +198,11 @@ class TestGitServiceQuietFailure:
     def test_is_branch_ancestor_of_default_uses_quiet_failure(self):
         """Test that _is_branch_ancestor_of_default uses run_command_quiet_on_failure."""
         with patch("autowt.services.git.run_command_quiet_on_failure") as mock_run:
-            mock_result = Mock()
-            mock_result.returncode = 128  # Git error
-            mock_result.stdout = ""
-            mock_result.stderr = "fatal: ambiguous argument 'origin/master'"
+            mock_result = SimpleNamespace(
+                returncode=128,  # Git error
+                stdout="",
+                stderr="fatal: ambiguous argument 'origin/master'",
+            )
             mock_run.return_value = mock_result
 
             result = self.git_service._is_branch_ancestor_of_default(
@@ -221,10 +220,11 @@ class TestGitServiceQuietFailure:
     def test_remote_branch_exists_uses_quiet_failure(self):
         """Test that _remote_branch_exists uses run_command_quiet_on_failure."""
         with patch("autowt.services.git.run_command_quiet_on_failure") as mock_run:
-            mock_result = Mock()
-            mock_result.returncode = 128  # Git error
-            mock_result.stdout = ""
-            mock_result.stderr = "fatal: ambiguous argument"
+            mock_result = SimpleNamespace(
+                returncode=128,  # Git error
+                stdout="",
+                stderr="fatal: ambiguous argument",
+            )
             mock_run.return_value = mock_result
 
             result = self.git_service._remote_branch_exists(
@@ -377,8 +377,7 @@ class TestBranchResolver:
     def test_try_fetch_specific_branch_succeeds(self):
         """Test that _try_fetch_specific_branch returns True when git fetch succeeds."""
         with patch("autowt.services.git.run_command_quiet_on_failure") as mock_run:
-            mock_result = Mock()
-            mock_result.returncode = 0
+            mock_result = SimpleNamespace(returncode=0)
             mock_run.return_value = mock_result
 
             result = self.git_service.branch_resolver._try_fetch_specific_branch(
@@ -397,10 +396,7 @@ class TestBranchResolver:
         """Test that _try_fetch_specific_branch falls back to simple fetch when first attempt fails."""
         with patch("autowt.services.git.run_command_quiet_on_failure") as mock_run:
             # First call fails, second succeeds
-            mock_result_fail = Mock()
-            mock_result_fail.returncode = 1
-            mock_result_success = Mock()
-            mock_result_success.returncode = 0
+            mock_result_success = SimpleNamespace(returncode=0)
             mock_run.side_effect = [Exception(), mock_result_success]
 
             result = self.git_service.branch_resolver._try_fetch_specific_branch(
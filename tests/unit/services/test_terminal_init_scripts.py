@@ -1,7 +1,7 @@
 """Tests for terminal service init script functionality."""
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 import pytest
 
@@ -10,13 +10,21 @@ from autowt.models import TerminalMode
 from autowt.services.terminal import TerminalService
 from tests.fixtures.service_builders import MockStateService
 
+TEST_PATH = Path("/test/worktree")
+TEST_PATH_WITH_SPACES = Path("/test/my worktree/branch")
+INIT_SCRIPT = "setup.sh"
 
-@pytest.fixture
+
+# TerminalService only stores its state service, so one instance can back the
+# whole module.
+@pytest.fixture(scope="module")
 def mock_state_service():
     """Mock state service for testing."""
     return MockStateService()
 
 
+# Function-scoped: TerminalService caches automate_terminal's check() result,
+# and tests patch check() with different capabilities.
 @pytest.fixture
 def terminal_service(mock_state_service):
     """Terminal service with mocked dependencies."""
@@ -24,15 +32,27 @@ def terminal_service(mock_state_service):
 
 
 @pytest.fixture
-def test_path():
-    """Test worktree path."""
-    return Path("/test/worktree")
+def assert_echo(capsys):
+    """Assert that the command printed for eval matches the expected line."""
 
+    def check(expected):
+        assert capsys.readouterr().out.strip() == expected
 
-@pytest.fixture
-def init_script():
-    """Sample init script."""
-    return "setup.sh"
+    return check
+
+
+class _RecordingStub:
+    """Stand-in for a TerminalService mode method that records its arguments."""
+
+    __slots__ = ("return_value", "calls")
+
+    def __init__(self, return_value=True):
+        self.return_value = return_value
+        self.calls = []
+
+    def __call__(self, *args):
+        self.calls.append(args)
+        return self.return_value
 
 
 class TestTerminalServiceInitScripts:
@@ -47,47 +67,57 @@ class TestTerminalServiceInitScripts:
                 "mise install && uv sync --extra=dev",
                 "cd /test/worktree; mise install && uv sync --extra=dev",
             ),
+            # Empty and whitespace-only scripts leave only the cd command
+            ("", "cd /test/worktree"),
+            ("   ", "cd /test/worktree"),
+            (
+                "echo 'test'; ls | grep '*.py' && echo $HOME",
+                "cd /test/worktree; echo 'test'; ls | grep '*.py' && echo $HOME",
+            ),
+            # Multi-line scripts are joined into a single line
+            (
+                "echo 'line1'\necho 'line2'\necho 'line3'",
+                "cd /test/worktree; echo 'line1'; echo 'line2'; echo 'line3'",
+            ),
         ],
     )
     def test_echo_commands(
-        self, terminal_service, test_path, capsys, script, expected_output
+        self, terminal_service, assert_echo, script, expected_output
     ):
         """Test echo mode with various init script configurations."""
-        success = terminal_service._echo_commands(test_path, script)
+        success = terminal_service._echo_commands(TEST_PATH, script)
 
-        captured = capsys.readouterr()
         assert success
-        assert captured.out.strip() == expected_output
+        assert_echo(expected_output)
 
     @patch("autowt.services.terminal.run_script_inplace")
     def test_inplace_commands_with_supported_terminal(
-        self, mock_run_script, terminal_service, test_path, init_script
+        self, mock_run_script, terminal_service
     ):
         """Test new inplace mode with mocked terminal execution."""
         mock_run_script.return_value = True
 
-        success = terminal_service._inplace_commands(test_path, init_script)
+        success = terminal_service._inplace_commands(TEST_PATH, INIT_SCRIPT)
 
         assert success
-        mock_run_script.assert_called_once_with("cd /test/worktree; setup.sh")
+        assert mock_run_script.call_args_list == [call("cd /test/worktree; setup.sh")]
 
     @patch("autowt.services.terminal.run_script_inplace")
     def test_inplace_commands_fallback_to_echo(
-        self, mock_run_script, terminal_service, test_path, init_script, capsys
+        self, mock_run_script, terminal_service, assert_echo
     ):
         """Test inplace mode falls back to echo when terminal doesn't support it."""
         mock_run_script.return_value = False
 
-        success = terminal_service._inplace_commands(test_path, init_script)
+        success = terminal_service._inplace_commands(TEST_PATH, INIT_SCRIPT)
 
-        captured = capsys.readouterr()
         assert success
-        assert captured.out.strip() == "cd /test/worktree; setup.sh"
+        assert_echo("cd /test/worktree; setup.sh")
 
     @patch("autowt.services.terminal.check")
     @patch("autowt.services.terminal.new_tab")
     def test_terminal_implementation_delegation_tab(
-        self, mock_new_tab, mock_check, terminal_service, test_path, init_script
+        self, mock_new_tab, mock_check, terminal_service
     ):
         """Test that TerminalService properly delegates to automate_terminal for tabs."""
         mock_check.return_value = {
@@ -100,19 +130,18 @@ class TestTerminalServiceInitScripts:
 
         # Test tab creation delegation
         success = terminal_service._tab_mode(
-            test_path, init_script, None, None, False, False
+            TEST_PATH, INIT_SCRIPT, None, None, False, False
         )
 
         assert success
-        mock_new_tab.assert_called_once_with(
-            working_directory=str(test_path),
-            paste_script=init_script,
-        )
+        assert mock_new_tab.call_args_list == [
+            call(working_directory=str(TEST_PATH), paste_script=INIT_SCRIPT)
+        ]
 
     @patch("autowt.services.terminal.check")
     @patch("autowt.services.terminal.new_window")
     def test_terminal_implementation_delegation_window(
-        self, mock_new_window, mock_check, terminal_service, test_path, init_script
+        self, mock_new_window, mock_check, terminal_service
     ):
         """Test that TerminalService properly delegates to automate_terminal for windows."""
         mock_check.return_value = {
@@ -125,66 +154,41 @@ class TestTerminalServiceInitScripts:
 
         # Test window creation delegation
         success = terminal_service._window_mode(
-            test_path, init_script, None, None, False, False
+            TEST_PATH, INIT_SCRIPT, None, None, False, False
         )
 
         assert success
-        mock_new_window.assert_called_once_with(
-            working_directory=str(test_path),
-            paste_script=init_script,
-        )
+        assert mock_new_window.call_args_list == [
+            call(working_directory=str(TEST_PATH), paste_script=INIT_SCRIPT)
+        ]
 
+    # Session-creating modes also receive branch_name, auto_confirm and
+    # ignore_same_session, which default to None, False, False
+    @pytest.mark.parametrize(
+        "mode,method_name,extra_args",
+        [
+            (TerminalMode.INPLACE, "_inplace_commands", ()),
+            (TerminalMode.ECHO, "_echo_commands", ()),
+            (TerminalMode.TAB, "_tab_mode", (None, False, False)),
+            (TerminalMode.WINDOW, "_window_mode", (None, False, False)),
+        ],
+    )
     def test_switch_to_worktree_delegates_correctly(
-        self, terminal_service, test_path, init_script
+        self,
+        terminal_service,
+        monkeypatch,
+        mode,
+        method_name,
+        extra_args,
     ):
         """Test that switch_to_worktree passes init_script to appropriate methods."""
-        with patch.object(terminal_service, "_inplace_commands") as mock_inplace:
-            mock_inplace.return_value = True
-
-            success = terminal_service.switch_to_worktree(
-                test_path, TerminalMode.INPLACE, init_script
-            )
-
-            assert success
-            mock_inplace.assert_called_once_with(test_path, init_script, None)
-
-        # Test ECHO mode delegation
-        with patch.object(terminal_service, "_echo_commands") as mock_echo:
-            mock_echo.return_value = True
-
-            success = terminal_service.switch_to_worktree(
-                test_path, TerminalMode.ECHO, init_script
-            )
+        stub = _RecordingStub()
+        monkeypatch.setattr(terminal_service, method_name, stub)
 
-            assert success
-            mock_echo.assert_called_once_with(test_path, init_script, None)
-
-        # Test TAB mode delegation
-        with patch.object(terminal_service, "_tab_mode") as mock_tab:
-            mock_tab.return_value = True
-
-            success = terminal_service.switch_to_worktree(
-                test_path, TerminalMode.TAB, init_script
-            )
-
-            assert success
-            # branch_name, auto_confirm, ignore_same_session default to None, False, False
-            mock_tab.assert_called_once_with(
-                test_path, init_script, None, None, False, False
-            )
-
-        # Test WINDOW mode delegation
-        with patch.object(terminal_service, "_window_mode") as mock_window:
-            mock_window.return_value = True
-
-            success = terminal_service.switch_to_worktree(
-                test_path, TerminalMode.WINDOW, init_script
-            )
+        success = terminal_service.switch_to_worktree(TEST_PATH, mode, INIT_SCRIPT)
 
-            assert success
-            mock_window.assert_called_once_with(
-                test_path, init_script, None, None, False, False
-            )
+        assert success
+        assert stub.calls == [(TEST_PATH, INIT_SCRIPT, None, *extra_args)]
 
     @patch("autowt.services.terminal.check")
     @patch("autowt.services.terminal.list_sessions")
@@ -197,8 +201,6 @@ class TestTerminalServiceInitScripts:
         mock_list_sessions,
         mock_check,
         terminal_service,
-        test_path,
-        init_script,
     ):
         """Test tab mode handles switching to existing sessions."""
         mock_check.return_value = {
@@ -208,12 +210,12 @@ class TestTerminalServiceInitScripts:
                 "can_paste_commands": True,
             }
         }
-        mock_list_sessions.return_value = [{"working_directory": str(test_path)}]
+        mock_list_sessions.return_value = [{"working_directory": str(TEST_PATH)}]
         mock_switch.return_value = True
 
         success = terminal_service._tab_mode(
-            test_path,
-            init_script,
+            TEST_PATH,
+            INIT_SCRIPT,
             None,
             "test-branch",
             auto_confirm=True,  # Skip user prompt
@@ -222,22 +224,20 @@ class TestTerminalServiceInitScripts:
 
         assert success
         # Should switch to session, not create new tab
-        mock_switch.assert_called_once_with(working_directory=str(test_path))
+        assert mock_switch.call_args_list == [call(working_directory=str(TEST_PATH))]
         mock_new_tab.assert_not_called()
 
 
 class TestShellIntegrationFile:
     """Tests for file-based shell integration in echo mode."""
 
-    def test_echo_commands_writes_to_file(
-        self, terminal_service, test_path, tmp_path, capsys
-    ):
+    def test_echo_commands_writes_to_file(self, terminal_service, tmp_path, capsys):
         """When shell_integration_file is set, cd command is written to file, not stdout."""
         tmpfile = tmp_path / "shell_integration"
         original = options.shell_integration_file
         try:
             options.shell_integration_file = str(tmpfile)
-            success = terminal_service._echo_commands(test_path, "setup.sh")
+            success = terminal_service._echo_commands(TEST_PATH, "setup.sh")
 
             captured = capsys.readouterr()
             assert success
@@ -247,29 +247,26 @@ class TestShellIntegrationFile:
             options.shell_integration_file = original
 
     def test_echo_commands_prints_to_stdout_without_file(
-        self, terminal_service, test_path, capsys
+        self, terminal_service, assert_echo
     ):
         """Without shell_integration_file, cd command goes to stdout as before."""
         original = options.shell_integration_file
         try:
             options.shell_integration_file = None
-            success = terminal_service._echo_commands(test_path, "setup.sh")
+            success = terminal_service._echo_commands(TEST_PATH, "setup.sh")
 
-            captured = capsys.readouterr()
             assert success
-            assert captured.out.strip() == "cd /test/worktree; setup.sh"
+            assert_echo("cd /test/worktree; setup.sh")
         finally:
             options.shell_integration_file = original
 
-    def test_echo_commands_file_with_no_init_script(
-        self, terminal_service, test_path, tmp_path
-    ):
+    def test_echo_commands_file_with_no_init_script(self, terminal_service, tmp_path):
         """File receives just the cd command when no init script is provided."""
         tmpfile = tmp_path / "shell_integration"
         original = options.shell_integration_file
         try:
             options.shell_integration_file = str(tmpfile)
-            success = terminal_service._echo_commands(test_path)
+            success = terminal_service._echo_commands(TEST_PATH)
 
             assert success
             assert tmpfile.read_text() == "cd /test/worktree"
@@ -280,51 +277,22 @@ class TestShellIntegrationFile:
 class TestInitScriptEdgeCases:
     """Test edge cases and error handling for init scripts."""
 
-    def test_empty_init_script_treated_as_none(
-        self, terminal_service, test_path, capsys
-    ):
-        """Test that empty string init script is handled gracefully in echo mode."""
-        success = terminal_service._echo_commands(test_path, "")
-
-        captured = capsys.readouterr()
-        assert success
-        assert captured.out.strip() == "cd /test/worktree"
-
-    def test_whitespace_only_init_script(self, terminal_service, test_path, capsys):
-        """Test init script with only whitespace in echo mode."""
-        success = terminal_service._echo_commands(test_path, "   ")
-
-        captured = capsys.readouterr()
-        assert success
-        # The whitespace gets trimmed and filtered out, leaving only the cd command
-        assert captured.out.strip() == "cd /test/worktree"
-
-    def test_init_script_with_special_characters(
-        self, terminal_service, test_path, capsys
+    @patch("autowt.services.terminal.run_script_inplace")
+    def test_whitespace_only_init_script_inplace(
+        self, mock_run_script, terminal_service
     ):
-        """Test init script with special shell characters in echo mode."""
-        special_script = "echo 'test'; ls | grep '*.py' && echo $HOME"
-        success = terminal_service._echo_commands(test_path, special_script)
-
-        captured = capsys.readouterr()
-        assert success
-        expected = f"cd /test/worktree; {special_script}"
-        assert captured.out.strip() == expected
+        """Test that inplace mode drops a whitespace-only init script."""
+        mock_run_script.return_value = True
 
-    def test_multiline_init_script(self, terminal_service, test_path, capsys):
-        """Test multi-line init script gets normalized to single line in echo mode."""
-        multiline_script = "echo 'line1'\necho 'line2'\necho 'line3'"
-        success = terminal_service._echo_commands(test_path, multiline_script)
+        success = terminal_service._inplace_commands(TEST_PATH, "   ", "\n")
 
-        captured = capsys.readouterr()
         assert success
-        expected = "cd /test/worktree; echo 'line1'; echo 'line2'; echo 'line3'"
-        assert captured.out.strip() == expected
+        assert mock_run_script.call_args_list == [call("cd /test/worktree")]
 
     @patch("autowt.services.terminal.check")
     @patch("autowt.services.terminal.new_tab")
     def test_terminal_tab_creation_failure(
-        self, mock_new_tab, mock_check, terminal_service, test_path
+        self, mock_new_tab, mock_check, terminal_service
     ):
         """Test handling of tab creation failure with init script."""
         mock_check.return_value = {
@@ -336,7 +304,7 @@ class TestInitScriptEdgeCases:
         mock_new_tab.return_value = False
 
         success = terminal_service._tab_mode(
-            test_path, "setup.sh", None, None, False, False
+            TEST_PATH, "setup.sh", None, None, False, False
         )
 
         assert not success
@@ -344,8 +312,7 @@ class TestInitScriptEdgeCases:
 
     def test_path_with_spaces_and_init_script(self, terminal_service, capsys):
         """Test handling paths with spaces combined with init scripts in echo mode."""
-        path_with_spaces = Path("/test/my worktree/branch")
-        success = terminal_service._echo_commands(path_with_spaces, "setup.sh")
+        success = terminal_service._echo_commands(TEST_PATH_WITH_SPACES, INIT_SCRIPT)
 
         captured = capsys.readouterr()
         assert success
@@ -1,56 +1,70 @@
 """Tests for new terminal mode functionality (ECHO and INPLACE)."""
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock
 
+import pytest
 from automate_terminal import TerminalNotFoundError
 
 from autowt.models import TerminalMode
+from autowt.services import terminal
 from autowt.services.terminal import TerminalService, run_script_inplace
 from tests.fixtures.service_builders import MockStateService
 
+TEST_PATH = Path("/test/worktree")
+INIT_SCRIPT = "setup.sh"
+
+
+# Tests only patch methods on the instance through monkeypatch, which restores
+# them after each test, so one service per class is enough.
+@pytest.fixture(scope="class")
+def terminal_service():
+    """TerminalService backed by a mock state service."""
+    return TerminalService(MockStateService())
+
+
+@pytest.fixture
+def mock_run_in_active_session(monkeypatch):
+    """Replace automate-terminal's run_in_active_session with a Mock."""
+    mock = Mock()
+    monkeypatch.setattr(terminal, "run_in_active_session", mock)
+    return mock
+
 
 class TestTerminalModes:
     """Tests for ECHO and INPLACE terminal modes."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_state_service = MockStateService()
-        self.terminal_service = TerminalService(self.mock_state_service)
-        self.test_path = Path("/test/worktree")
-        self.init_script = "setup.sh"
-
-    def test_switch_to_worktree_echo_mode(self):
+    def test_switch_to_worktree_echo_mode(self, terminal_service, monkeypatch):
         """Test switch_to_worktree with ECHO mode."""
-        with patch.object(self.terminal_service, "_echo_commands") as mock_echo:
-            mock_echo.return_value = True
+        mock_echo = Mock(return_value=True)
+        monkeypatch.setattr(terminal_service, "_echo_commands", mock_echo)
 
-            success = self.terminal_service.switch_to_worktree(
-                self.test_path, TerminalMode.ECHO, self.init_script
-            )
+        success = terminal_service.switch_to_worktree(
+            TEST_PATH, TerminalMode.ECHO, INIT_SCRIPT
+        )
 
-            assert success
-            mock_echo.assert_called_once_with(self.test_path, self.init_script, None)
+        assert success
+        mock_echo.assert_called_once_with(TEST_PATH, INIT_SCRIPT, None)
 
-    def test_switch_to_worktree_inplace_mode(self):
+    def test_switch_to_worktree_inplace_mode(self, terminal_service, monkeypatch):
         """Test switch_to_worktree with INPLACE mode."""
-        with patch.object(self.terminal_service, "_inplace_commands") as mock_inplace:
-            mock_inplace.return_value = True
+        mock_inplace = Mock(return_value=True)
+        monkeypatch.setattr(terminal_service, "_inplace_commands", mock_inplace)
 
-            success = self.terminal_service.switch_to_worktree(
-                self.test_path, TerminalMode.INPLACE, self.init_script
-            )
+        success = terminal_service.switch_to_worktree(
+            TEST_PATH, TerminalMode.INPLACE, INIT_SCRIPT
+        )
 
-            assert success
-            mock_inplace.assert_called_once_with(self.test_path, self.init_script, None)
+        assert success
+        mock_inplace.assert_called_once_with(TEST_PATH, INIT_SCRIPT, None)
 
-    def test_switch_to_worktree_unknown_mode(self):
+    def test_switch_to_worktree_unknown_mode(self, terminal_service):
         """Test switch_to_worktree with unknown mode."""
         # Mock an unknown mode
         unknown_mode = "unknown"
 
-        success = self.terminal_service.switch_to_worktree(
-            self.test_path, unknown_mode, self.init_script
+        success = terminal_service.switch_to_worktree(
+            TEST_PATH, unknown_mode, INIT_SCRIPT
         )
 
         assert not success
@@ -59,7 +73,6 @@ class TestTerminalModes:
 class TestInplaceExecution:
     """Tests for run_script_inplace function."""
 
-    @patch("autowt.services.terminal.run_in_active_session")
     def test_run_script_inplace_iterm2_success(self, mock_run_in_active_session):
         """Test successful command execution in iTerm2."""
         mock_run_in_active_session.return_value = True
@@ -70,7 +83,6 @@ class TestInplaceExecution:
         assert success
         mock_run_in_active_session.assert_called_once_with(command, debug=False)
 
-    @patch("autowt.services.terminal.run_in_active_session")
     def test_run_script_inplace_failure(self, mock_run_in_active_session):
         """Test command execution failure."""
         mock_run_in_active_session.return_value = False
@@ -81,7 +93,6 @@ class TestInplaceExecution:
         assert not success
         mock_run_in_active_session.assert_called_once_with(command, debug=False)
 
-    @patch("autowt.services.terminal.run_in_active_session")
     def test_run_script_inplace_unsupported_terminal(self, mock_run_in_active_session):
         """Test unsupported terminal returns False."""
         mock_run_in_active_session.side_effect = TerminalNotFoundError(
@@ -93,7 +104,6 @@ class TestInplaceExecution:
 
         assert not success
 
-    @patch("autowt.services.terminal.run_in_active_session")
     def test_run_script_inplace_exception(self, mock_run_in_active_session):
         """Test exception handling."""
         mock_run_in_active_session.side_effect = Exception("Something went wrong")
@@ -107,30 +117,23 @@ class TestInplaceExecution:
 class TestTerminalModeIntegration:
     """Integration tests for terminal modes with different terminals."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_state_service = MockStateService()
-        self.terminal_service = TerminalService(self.mock_state_service)
-        self.test_path = Path("/test/worktree")
-
-    @patch("autowt.services.terminal.run_script_inplace")
-    def test_inplace_mode_with_supported_terminal(self, mock_run_script):
+    def test_inplace_mode_with_supported_terminal(self, terminal_service, monkeypatch):
         """Test inplace mode with supported terminal."""
-        mock_run_script.return_value = True
+        mock_run_script = Mock(return_value=True)
+        monkeypatch.setattr(terminal, "run_script_inplace", mock_run_script)
 
-        success = self.terminal_service._inplace_commands(self.test_path, "setup.sh")
+        success = terminal_service._inplace_commands(TEST_PATH, "setup.sh")
 
         assert success
         mock_run_script.assert_called_once_with("cd /test/worktree; setup.sh")
 
-    @patch("autowt.services.terminal.run_script_inplace")
     def test_inplace_mode_fallback_for_unsupported_terminal(
-        self, mock_run_script, capsys
+        self, terminal_service, monkeypatch, capsys
     ):
         """Test inplace mode falls back to echo for unsupported terminals."""
-        mock_run_script.return_value = False
+        monkeypatch.setattr(terminal, "run_script_inplace", Mock(return_value=False))
 
-        success = self.terminal_service._inplace_commands(self.test_path, "setup.sh")
+        success = terminal_service._inplace_commands(TEST_PATH, "setup.sh")
 
         captured = capsys.readouterr()
         assert success
@@ -73,9 +73,11 @@ class TestCleanupFirstRun:
                     assert mode == CleanupMode.INTERACTIVE
 
                     # Check that GitHub unavailable message was shown
-                    calls = [str(call) for call in mock_print.call_args_list]
-                    assert any("GitHub CLI" in str(call) for call in calls)
-                    assert any("cli.github.com" in str(call) for call in calls)
+                    printed = [
+                        call.args[0] for call in mock_print.call_args_list if call.args
+                    ]
+                    assert any("GitHub CLI" in line for line in printed)
+                    assert any("cli.github.com" in line for line in printed)
 
     def test_prompt_cleanup_mode_selection_choices(self):
         """Test all prompt choices work correctly."""
@@ -4,6 +4,7 @@ import os
 import tempfile
 from pathlib import Path
 from subprocess import TimeoutExpired
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,6 +17,10 @@ from autowt.hooks import (
     merge_hooks_for_custom_script,
 )
 from autowt.models import CustomScript
+from autowt.utils import run_command_cached
+
+# subprocess.run result for tests that only check the returncode
+OK_RESULT = SimpleNamespace(returncode=0)
 
 
 class TestHookRunner:
@@ -32,10 +37,9 @@ class TestHookRunner:
     def test_run_hook_success(self, mock_subprocess_run):
         """Test successful hook execution."""
         # Mock successful subprocess run
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Hook executed successfully"
-        mock_result.stderr = ""
+        mock_result = SimpleNamespace(
+            returncode=0, stdout="Hook executed successfully", stderr=""
+        )
         mock_subprocess_run.return_value = mock_result
 
         # Run the hook
@@ -75,10 +79,7 @@ class TestHookRunner:
     def test_run_hook_failure(self, mock_subprocess_run):
         """Test hook execution failure."""
         # Mock failed subprocess run
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Command failed"
+        mock_result = SimpleNamespace(returncode=1, stdout="", stderr="Command failed")
         mock_subprocess_run.return_value = mock_result
 
         # Run the hook
@@ -112,6 +113,24 @@ class TestHookRunner:
         # Verify failure due to timeout
         assert success is False
 
+    @patch("subprocess.run", return_value=OK_RESULT)
+    def test_run_hook_clears_command_cache(self, mock_subprocess_run):
+        """Test that git queries are re-run after a hook script executes."""
+        with patch(
+            "autowt.utils.run_command", return_value=OK_RESULT
+        ) as mock_run_command:
+            run_command_cached(["git", "worktree", "list"])
+            self.hook_runner.run_hook(
+                "git worktree add ../other",
+                HookType.POST_CREATE,
+                self.test_worktree_dir,
+                self.test_main_repo_dir,
+                self.test_branch_name,
+            )
+            run_command_cached(["git", "worktree", "list"])
+
+        assert mock_run_command.call_count == 2
+
     def test_run_hook_empty_script(self):
         """Test that empty scripts are handled gracefully."""
         # Test with None
@@ -148,10 +167,7 @@ class TestHookRunner:
     def test_run_hooks_global_and_project(self, mock_subprocess_run):
         """Test running both global and project hooks."""
         # Mock successful subprocess runs
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
+        mock_result = SimpleNamespace(returncode=0, stdout="", stderr="")
         mock_subprocess_run.return_value = mock_result
 
         global_scripts = ["echo 'global hook 1'", "echo 'global hook 2'"]
@@ -243,10 +259,7 @@ class TestHookRunner:
     @patch("subprocess.run")
     def test_multiline_script_preserved(self, mock_subprocess_run):
         """Test that multiline scripts are passed through unchanged."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
+        mock_result = SimpleNamespace(returncode=0, stdout="", stderr="")
         mock_subprocess_run.return_value = mock_result
 
         multiline_script = """
@@ -275,9 +288,7 @@ class TestHookRunner:
     @patch("subprocess.run")
     def test_pre_create_hook_runs_in_main_repo_dir(self, mock_subprocess_run):
         """Test that pre_create hooks run in main repo directory since worktree doesn't exist yet."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_subprocess_run.return_value = mock_result
+        mock_subprocess_run.return_value = OK_RESULT
 
         # Run pre_create hook
         success = self.hook_runner.run_hook(
@@ -303,9 +314,7 @@ class TestHookRunner:
     @patch("subprocess.run")
     def test_post_cleanup_hook_runs_in_main_repo_dir(self, mock_subprocess_run):
         """Test that post_cleanup hooks run in main repo directory since worktree was deleted."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_subprocess_run.return_value = mock_result
+        mock_subprocess_run.return_value = OK_RESULT
 
         # Run post_cleanup hook
         success = self.hook_runner.run_hook(
@@ -331,9 +340,7 @@ class TestHookRunner:
     @patch("subprocess.run")
     def test_other_hooks_run_in_worktree_dir(self, mock_subprocess_run):
         """Test that hooks other than pre_create and post_cleanup run in worktree directory."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_subprocess_run.return_value = mock_result
+        mock_subprocess_run.return_value = OK_RESULT
 
         # Test various hook types that should run in worktree directory
         hook_types = [